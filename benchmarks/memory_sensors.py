@@ -0,0 +1,152 @@
+"""Memory benchmark: bytes per MyCurl sensor at 10,000 sensors.
+
+Measures three layouts separately, so each saving is attributable:
+
+- before: the previous layout (entities holding their own name/filter/type,
+  coordinators keeping the whole parsed document)
+- specs: a SensorSpecs table per coordinator and index-only entities, still
+  with the whole parsed document
+- leaf-only: the same plus leaf-only coordinators
+
+Run from the repository root in an environment with Home Assistant installed:
+
+	python benchmarks/memory_sensors.py
+"""
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from homeassistant.components.sensor import SensorEntity  # noqa: E402
+from homeassistant.helpers.update_coordinator import CoordinatorEntity  # noqa: E402
+
+from custom_components.mycurl.paths import compile_filter  # noqa: E402
+from custom_components.mycurl.sensor import LeafValues, MyCurlMultiSensor, SensorSpecs  # noqa: E402
+
+SENSORS = 10_000
+FIELDS_PER_ENDPOINT = 40
+ENDPOINTS = SENSORS // FIELDS_PER_ENDPOINT
+HISTORY_ROWS = 200
+
+
+class _Coordinator:
+	"""Stand-in coordinator; CoordinatorEntity only keeps a reference to it."""
+
+	def __init__(self, url, data, specs=None):
+		self._url = url
+		self.data = data
+		self.specs = specs
+
+
+class _PreviousMultiSensor(CoordinatorEntity, SensorEntity):
+	"""MyCurlMultiSensor as it was before SensorSpecs."""
+
+	def __init__(self, name, jq_filter, data_type, coordinator):
+		super().__init__(coordinator)
+		self._name = name
+		self._jq_filter = jq_filter
+		self._data_type = data_type
+		if self._data_type == "numeric":
+			self._attr_device_class = "measurement"
+			self._attr_state_class = "measurement"
+
+
+def _payload(endpoint):
+	# 40 fields our sensors read, plus the kind of bulk real APIs return alongside them
+	return json.dumps({
+		"station": f"station-{endpoint}",
+		"readings": {f"field_{i}": i * 1.5 for i in range(FIELDS_PER_ENDPOINT)},
+		"history": [{"t": 1700000000 + row, "v": row * 0.1, "flag": "ok"} for row in range(HISTORY_ROWS)],
+	})
+
+
+def _entries():
+	# What config entries hold after being loaded from .storage (outside the measurement)
+	return [
+		json.loads(json.dumps({
+			"url": f"http://station-{endpoint}.local/api",
+			"sensors": [
+				{"name": f"Station {endpoint} - field {i}", "jq_filter": f".readings.field_{i}", "data_type": "numeric"}
+				for i in range(FIELDS_PER_ENDPOINT)
+			],
+		}))
+		for endpoint in range(ENDPOINTS)
+	]
+
+
+def _build_previous(entries, payloads):
+	# Like the old async_setup_entry: read each sensor_cfg and keep nothing but the entities
+	keep = []
+	for entry, payload in zip(entries, payloads):
+		coordinator = _Coordinator(entry["url"], json.loads(payload))
+		sensors = [
+			_PreviousMultiSensor(cfg.get("name"), cfg.get("jq_filter"), cfg.get("data_type"), coordinator)
+			for cfg in entry["sensors"]
+		]
+		keep.append((coordinator, sensors))
+	return keep
+
+
+def _build_specs(entries, payloads):
+	keep = []
+	for entry, payload in zip(entries, payloads):
+		specs = SensorSpecs.from_config(entry["sensors"])
+		coordinator = _Coordinator(entry["url"], json.loads(payload), specs)
+		sensors = [MyCurlMultiSensor(coordinator, index) for index in range(len(specs))]
+		keep.append((coordinator, sensors))
+	return keep
+
+
+def _build_leaf_only(entries, payloads):
+	keep = []
+	for entry, payload in zip(entries, payloads):
+		specs = SensorSpecs.from_config(entry["sensors"])
+		document = json.loads(payload)
+		leaves = LeafValues((f, compile_filter(f)(document)) for f in specs.filters)
+		del document
+		coordinator = _Coordinator(entry["url"], leaves, specs)
+		sensors = [MyCurlMultiSensor(coordinator, index) for index in range(len(specs))]
+		keep.append((coordinator, sensors))
+	return keep
+
+
+def _measure(build, entries, payloads):
+	gc.collect()
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	kept = build(entries, payloads)
+	gc.collect()
+	used = tracemalloc.get_traced_memory()[0] - before
+	tracemalloc.stop()
+	del kept
+	return used
+
+
+def main():
+	entries = _entries()
+	payloads = [_payload(endpoint) for endpoint in range(ENDPOINTS)]
+	# Warm the shared filter cache so neither side pays for it
+	for entry in entries:
+		for cfg in entry["sensors"]:
+			compile_filter(cfg["jq_filter"])
+
+	previous = _measure(_build_previous, entries, payloads)
+	specs = _measure(_build_specs, entries, payloads)
+	leaf_only = _measure(_build_leaf_only, entries, payloads)
+	print(f"{SENSORS} sensors on {ENDPOINTS} endpoints ({FIELDS_PER_ENDPOINT} fields each)")
+	for label, used in (("before", previous), ("specs", specs), ("leaf-only", leaf_only)):
+		print(f"{label + ':':<11}{used / SENSORS:10.1f} bytes/sensor  ({used / 1024 / 1024:.1f} MiB)")
+	print(f"SensorSpecs saving vs before:     {(previous - specs) / previous:7.1%}")
+	print(f"leaf-only saving on top of specs: {(specs - leaf_only) / specs:7.1%}")
+	# The same two layouts without payloads: what the entities and their config cost on their own
+	empty = ["{}"] * ENDPOINTS
+	entities_before = _measure(_build_previous, entries, empty) / SENSORS
+	entities_specs = _measure(_build_specs, entries, empty) / SENSORS
+	print(f"entities alone: before {entities_before:.1f}, specs {entities_specs:.1f} bytes/sensor")
+
+
+if __name__ == "__main__":
+	main()
@@ -1,18 +1,46 @@
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.const import Platform
 import logging
+import voluptuous as vol
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "mycurl"
 PLATFORMS = [Platform.SENSOR]
 
+SERVICE_RELOAD_PRESETS = "reload_presets"
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # type: ignore[override]
-	"""Set up MyCurl from YAML (no action needed)."""
+	"""Set up MyCurl from YAML and register integration-wide services."""
+	from .presets import async_get_catalog
+	from .profiling import (
+		ATTR_DURATION, ATTR_MODE, DEFAULT_DURATION, MAX_DURATION, MODE_SPANS, PROFILE_MODES, SERVICE_PROFILE,
+		async_get_profiler,
+	)
+
+	async def _async_reload_presets(call: ServiceCall) -> None:
+		catalog = await async_get_catalog(hass, reload=True)
+		_LOGGER.info("Reloaded %d MyCurl presets", len(catalog))
+
+	async def _async_profile(call: ServiceCall) -> None:
+		await async_get_profiler(hass).async_run(call.data[ATTR_DURATION], call.data[ATTR_MODE])
+
+	hass.services.async_register(DOMAIN, SERVICE_RELOAD_PRESETS, _async_reload_presets)
+	hass.services.async_register(
+		DOMAIN,
+		SERVICE_PROFILE,
+		_async_profile,
+		schema=vol.Schema({
+			vol.Optional(ATTR_DURATION, default=DEFAULT_DURATION): vol.All(
+				vol.Coerce(float), vol.Range(min=1, max=MAX_DURATION)
+			),
+			vol.Optional(ATTR_MODE, default=MODE_SPANS): vol.In(PROFILE_MODES),
+		}),
+	)
 	return True
 
 
@@ -0,0 +1,228 @@
+"""Request authentication for MyCurl: static credentials and a shared token cache."""
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+
+from .paths import compile_filter
+from .request import DEFAULT_TIMEOUT, async_get_session
+
+_LOGGER = logging.getLogger(__name__)
+
+CONF_AUTH_TYPE = "auth_type"
+CONF_API_KEY = "api_key"
+CONF_API_KEY_HEADER = "api_key_header"
+CONF_USERNAME = "username"
+CONF_PASSWORD = "password"
+CONF_TOKEN = "token"
+CONF_TOKEN_URL = "token_url"
+CONF_TOKEN_FIELD = "token_field"
+CONF_CLIENT_ID = "client_id"
+CONF_CLIENT_SECRET = "client_secret"
+CONF_SCOPE = "scope"
+CONF_HEADERS = "headers"
+CONF_METHOD = "method"
+
+AUTH_NONE = "none"
+AUTH_API_KEY = "api_key"
+AUTH_BEARER = "bearer"
+AUTH_BASIC = "basic"
+AUTH_OAUTH2 = "oauth2_client_credentials"
+AUTH_LOGIN = "login"
+AUTH_TYPES = [AUTH_NONE, AUTH_API_KEY, AUTH_BEARER, AUTH_BASIC, AUTH_OAUTH2, AUTH_LOGIN]
+TOKEN_AUTH_TYPES = (AUTH_OAUTH2, AUTH_LOGIN)
+
+METHODS = ["GET", "POST"]
+DEFAULT_METHOD = "GET"
+DEFAULT_API_KEY_HEADER = "X-API-Key"
+DEFAULT_TOKEN_FIELD = "access_token"
+
+# Tokens without expires_in are assumed to live this long
+DEFAULT_TOKEN_TTL = 3600
+# Treat tokens as expired this long before the server says so (clock skew, request latency)
+EXPIRY_MARGIN = 30
+# Inside this window a still-valid token is served while a replacement is fetched in the background;
+# short-lived tokens use the second half of their lifetime instead
+REFRESH_AHEAD = 120
+
+DATA_TOKEN_MANAGER = "mycurl_token_manager"
+
+
+class Credentials(NamedTuple):
+	"""Everything that identifies one token; equal credentials share one cached token."""
+
+	auth_type: str
+	token_url: str
+	client_id: str = ""
+	client_secret: str = ""
+	username: str = ""
+	password: str = ""
+	scope: str = ""
+	token_field: str = DEFAULT_TOKEN_FIELD
+
+
+class RequestOptions(NamedTuple):
+	"""Method, static headers and auth for one endpoint, derived from entry data."""
+
+	method: str
+	headers: tuple
+	auth_type: str
+	api_key: str = ""
+	api_key_header: str = DEFAULT_API_KEY_HEADER
+	token: str = ""
+	username: str = ""
+	password: str = ""
+	credentials: Optional[Credentials] = None
+
+
+def parse_headers(raw: Any) -> Dict[str, str]:
+	"""Headers come from the flow as a JSON object string (or already a dict)."""
+	if not raw:
+		return {}
+	if isinstance(raw, str):
+		raw = json.loads(raw)
+	if not isinstance(raw, dict):
+		raise ValueError("Headers must be a JSON object")
+	return {str(k): str(v) for k, v in raw.items()}
+
+
+def request_options(data: Dict[str, Any]) -> RequestOptions:
+	auth_type = data.get(CONF_AUTH_TYPE) or AUTH_NONE
+	credentials = None
+	if auth_type in TOKEN_AUTH_TYPES:
+		credentials = Credentials(
+			auth_type=auth_type,
+			token_url=data.get(CONF_TOKEN_URL, "").strip(),
+			client_id=data.get(CONF_CLIENT_ID, ""),
+			client_secret=data.get(CONF_CLIENT_SECRET, ""),
+			username=data.get(CONF_USERNAME, ""),
+			password=data.get(CONF_PASSWORD, ""),
+			scope=data.get(CONF_SCOPE, ""),
+			token_field=data.get(CONF_TOKEN_FIELD) or DEFAULT_TOKEN_FIELD,
+		)
+	try:
+		headers = parse_headers(data.get(CONF_HEADERS))
+	except ValueError as e:
+		_LOGGER.error("Ignoring invalid headers %s: %s", data.get(CONF_HEADERS), e)
+		headers = {}
+	return RequestOptions(
+		method=(data.get(CONF_METHOD) or DEFAULT_METHOD).upper(),
+		headers=tuple(sorted(headers.items())),
+		auth_type=auth_type,
+		api_key=data.get(CONF_API_KEY, ""),
+		api_key_header=data.get(CONF_API_KEY_HEADER) or DEFAULT_API_KEY_HEADER,
+		token=data.get(CONF_TOKEN, ""),
+		username=data.get(CONF_USERNAME, ""),
+		password=data.get(CONF_PASSWORD, ""),
+		credentials=credentials,
+	)
+
+
+class _CachedToken(NamedTuple):
+	token: str
+	expires_at: float
+	refresh_at: float
+
+
+class TokenManager:
+	"""Fetches each credential set's token once and shares it across every entry using it.
+
+	Concurrent callers for the same credentials join one in-flight fetch; tokens
+	close to expiry are refreshed in the background while the old one is still served.
+	"""
+
+	def __init__(self, hass: HomeAssistant):
+		self._hass = hass
+		self._tokens: Dict[Credentials, _CachedToken] = {}
+		self._inflight: Dict[Credentials, asyncio.Task] = {}
+
+	async def async_get_token(self, credentials: Credentials) -> str:
+		cached = self._tokens.get(credentials)
+		now = time.monotonic()
+		if cached is not None and now < cached.expires_at:
+			if now >= cached.refresh_at:
+				self._refresh(credentials)
+			return cached.token
+		return await asyncio.shield(self._refresh(credentials))
+
+	def invalidate(self, credentials: Credentials) -> None:
+		"""Drop a token the server rejected so the next call fetches a new one."""
+		self._tokens.pop(credentials, None)
+
+	def _refresh(self, credentials: Credentials) -> asyncio.Task:
+		task = self._inflight.get(credentials)
+		if task is None:
+			task = self._hass.async_create_task(self._async_fetch(credentials))
+			self._inflight[credentials] = task
+			task.add_done_callback(lambda done: self._async_fetch_done(credentials, done))
+		return task
+
+	def _async_fetch_done(self, credentials: Credentials, task: asyncio.Task) -> None:
+		self._inflight.pop(credentials, None)
+		# Background refreshes have no awaiter; surface their failure here
+		if not task.cancelled() and task.exception() is not None:
+			_LOGGER.error("Token request to %s failed: %s", credentials.token_url, task.exception())
+
+	async def _async_fetch(self, credentials: Credentials) -> str:
+		session = async_get_session(self._hass)
+		if credentials.auth_type == AUTH_OAUTH2:
+			form = {
+				"grant_type": "client_credentials",
+				"client_id": credentials.client_id,
+				"client_secret": credentials.client_secret,
+			}
+			if credentials.scope:
+				form["scope"] = credentials.scope
+			kwargs = {"data": form}
+		else:
+			kwargs = {"json": {"username": credentials.username, "password": credentials.password}}
+		# The shared session doesn't auto-decompress, so ask for an uncompressed token response
+		async with session.post(
+			credentials.token_url,
+			headers={"Accept-Encoding": "identity"},
+			timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+			**kwargs,
+		) as response:
+			response.raise_for_status()
+			payload = json.loads(await response.read())
+		token = compile_filter(credentials.token_field)(payload)
+		if token is None and credentials.token_field == DEFAULT_TOKEN_FIELD:
+			token = payload.get("token") if isinstance(payload, dict) else None
+		if not token:
+			raise ValueError(f"No '{credentials.token_field}' in token response from {credentials.token_url}")
+		try:
+			ttl = float(payload.get("expires_in", DEFAULT_TOKEN_TTL))
+		except (AttributeError, TypeError, ValueError):
+			ttl = DEFAULT_TOKEN_TTL
+		now = time.monotonic()
+		lifetime = max(ttl - EXPIRY_MARGIN, 1)
+		expires_at = now + lifetime
+		self._tokens[credentials] = _CachedToken(str(token), expires_at, expires_at - min(REFRESH_AHEAD, lifetime / 2))
+		_LOGGER.debug("Fetched token from %s, valid for %.0fs", credentials.token_url, ttl)
+		return str(token)
+
+
+def async_get_token_manager(hass: HomeAssistant) -> TokenManager:
+	manager = hass.data.get(DATA_TOKEN_MANAGER)
+	if manager is None:
+		manager = hass.data[DATA_TOKEN_MANAGER] = TokenManager(hass)
+	return manager
+
+
+async def async_request_headers(hass: HomeAssistant, options: RequestOptions) -> Dict[str, str]:
+	"""Static headers plus whatever the auth type injects."""
+	headers = dict(options.headers)
+	if options.auth_type == AUTH_API_KEY and options.api_key:
+		headers[options.api_key_header] = options.api_key
+	elif options.auth_type == AUTH_BEARER and options.token:
+		headers["Authorization"] = f"Bearer {options.token}"
+	elif options.auth_type == AUTH_BASIC:
+		headers["Authorization"] = aiohttp.BasicAuth(options.username, options.password).encode()
+	elif options.credentials is not None:
+		token = await async_get_token_manager(hass).async_get_token(options.credentials)
+		headers["Authorization"] = f"Bearer {token}"
+	return headers
@@ -2,167 +2,153 @@
 import logging
 import json
 import asyncio
+import re
 from typing import Any, Dict, List, Optional
 
 import voluptuous as vol
 import aiohttp
 from homeassistant import config_entries
-from homeassistant.const import CONF_NAME, CONF_SCAN_INTERVAL
+import homeassistant.helpers.config_validation as cv
+from homeassistant.components import webhook
+from homeassistant.const import CONF_NAME, CONF_SCAN_INTERVAL, CONF_WEBHOOK_ID
 from .sensor import (
     CONF_CURL_COMMAND,
     CONF_DATA_TYPE,
+    CONF_LEAF_ONLY,
+    CONF_MIN_REFRESH_AGE,
     DATA_TYPE_NUMERIC,
     DATA_TYPE_TEXT,
+    DEFAULT_MIN_REFRESH_AGE,
     DEFAULT_NAME,
     DEFAULT_SCAN_INTERVAL,
     build_curl_command,
 )
+from .parsers import (
+    CONF_CSV_DELIMITER,
+    CONF_CSV_HEADER,
+    CONF_CSV_KEY_COLUMN,
+    CONF_PARSER,
+    CONF_TEXT_GROUP,
+    CONF_TEXT_PATTERN,
+    PARSER_AUTO,
+    PARSER_CSV,
+    PARSER_JSON,
+    PARSER_TEXT,
+    PARSERS,
+    ParseError,
+    parse_body,
+    parser_options,
+)
+from .history import CONF_HISTORY_SENSORS, CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE, MAX_HISTORY_SIZE, STATS
+from .pagination import (
+    CONF_CURSOR_PARAM,
+    CONF_CURSOR_PATH,
+    CONF_ITEMS_PATH,
+    CONF_LIMIT,
+    CONF_MAX_BYTES,
+    CONF_MAX_PAGES,
+    CONF_NEXT_PATH,
+    CONF_PAGE_PARAM,
+    CONF_PAGINATION,
+    CONF_START_PAGE,
+    CONF_TOTAL_PATH,
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_PAGES,
+    PAGINATION_CURSOR,
+    PAGINATION_MODES,
+    PAGINATION_NONE,
+)
+from .auth import (
+    AUTH_API_KEY,
+    AUTH_BASIC,
+    AUTH_BEARER,
+    AUTH_LOGIN,
+    AUTH_NONE,
+    AUTH_OAUTH2,
+    AUTH_TYPES,
+    CONF_API_KEY,
+    CONF_API_KEY_HEADER,
+    CONF_AUTH_TYPE,
+    CONF_CLIENT_ID,
+    CONF_CLIENT_SECRET,
+    CONF_HEADERS,
+    CONF_METHOD,
+    CONF_PASSWORD,
+    CONF_SCOPE,
+    CONF_TOKEN,
+    CONF_TOKEN_FIELD,
+    CONF_TOKEN_URL,
+    CONF_USERNAME,
+    DEFAULT_API_KEY_HEADER,
+    DEFAULT_METHOD,
+    DEFAULT_TOKEN_FIELD,
+    METHODS,
+    async_request_headers,
+    parse_headers,
+    request_options,
+)
+from .paths import PathIndex, compile_filter, is_simple_path
+from .presets import async_get_catalog
+from .request import CONF_COMPRESSION, DEFAULT_COMPRESSION
+from .webhook import CONF_DEBOUNCE, CONF_WEBHOOK_SECRET, DEFAULT_DEBOUNCE, async_notify_webhook_url
 
 _LOGGER = logging.getLogger(__name__)
 
+KEY_PAGE_SIZE = 50
+# Fields asked for per auth type, with their defaults
+AUTH_FIELDS = {
+    AUTH_API_KEY: [(CONF_API_KEY, ""), (CONF_API_KEY_HEADER, DEFAULT_API_KEY_HEADER)],
+    AUTH_BEARER: [(CONF_TOKEN, "")],
+    AUTH_BASIC: [(CONF_USERNAME, ""), (CONF_PASSWORD, "")],
+    AUTH_OAUTH2: [(CONF_TOKEN_URL, ""), (CONF_CLIENT_ID, ""), (CONF_CLIENT_SECRET, ""), (CONF_SCOPE, "")],
+    AUTH_LOGIN: [(CONF_TOKEN_URL, ""), (CONF_USERNAME, ""), (CONF_PASSWORD, ""), (CONF_TOKEN_FIELD, DEFAULT_TOKEN_FIELD)],
+}
+AUTH_REQUIRED = {CONF_API_KEY, CONF_TOKEN, CONF_USERNAME, CONF_TOKEN_URL, CONF_CLIENT_ID, CONF_CLIENT_SECRET}
+TYPE_ICONS = {"number": "🔢", "boolean": "🔘", "string": "📝", "null": "∅", "object": "📁", "array": "📋"}
+
 CONF_URL = "url"
 CONF_JQ_FILTER = "jq_filter"
 CONF_KEY_SELECT = "key_select"
+CONF_KEY_FILTER = "key_filter"
+CONF_PAGE = "page"
+CONF_KEY_MULTI = "key_multi"
+CONF_NUMERIC_UNDER = "numeric_under"
 CONF_REFRESH = "refresh"
 CONF_CREATE = "create"
 CONF_PRESET = "preset"
-CONF_API_KEY = "api_key"
-CONF_USERNAME = "username"
-CONF_PASSWORD = "password"
-CONF_TOKEN = "token"
-CONF_HEADERS = "headers"
-CONF_METHOD = "method"
-
-# Enhanced presets with more popular APIs
-PRESETS = {
-    "Random Advice": {
-        "name": "Random Advice",
-        "url_template": "https://api.adviceslip.com/advice",
-        "description": "Get a random piece of advice",
-        "required_params": [],
-        "sensors": [
-            {"key": "slip.advice", "name": "Advice", "type": DATA_TYPE_TEXT},
-            {"key": "slip.id", "name": "Advice ID", "type": DATA_TYPE_NUMERIC},
-        ],
-    },
-    "Trivia Question": {
-        "name": "Trivia Question",
-        "url_template": "https://opentdb.com/api.php?amount=1",
-        "description": "Get a random trivia question",
-        "required_params": [],
-        "sensors": [
-            {"key": "results[0].question", "name": "Question", "type": DATA_TYPE_TEXT},
-            {"key": "results[0].correct_answer", "name": "Correct Answer", "type": DATA_TYPE_TEXT},
-            {"key": "results[0].category", "name": "Category", "type": DATA_TYPE_TEXT},
-            {"key": "results[0].difficulty", "name": "Difficulty", "type": DATA_TYPE_TEXT},
-            {"key": "results[0].type", "name": "Type", "type": DATA_TYPE_TEXT},
-        ],
-    },
-    "Random Activity": {
-        "name": "Random Activity",
-        "url_template": "https://bored-api.appbrewery.com/random",
-        "description": "Get a random activity suggestion",
-        "required_params": [],
-        "sensors": [
-            {"key": "activity", "name": "Activity", "type": DATA_TYPE_TEXT},
-            {"key": "type", "name": "Type", "type": DATA_TYPE_TEXT},
-            {"key": "participants", "name": "Participants", "type": DATA_TYPE_NUMERIC},
-            {"key": "price", "name": "Price", "type": DATA_TYPE_NUMERIC},
-            {"key": "availability", "name": "Availability", "type": DATA_TYPE_NUMERIC},
-            {"key": "accessibility", "name": "Accessibility", "type": DATA_TYPE_TEXT},
-            {"key": "duration", "name": "Duration", "type": DATA_TYPE_TEXT},
-            {"key": "kidFriendly", "name": "Kid Friendly", "type": DATA_TYPE_TEXT},
-            {"key": "link", "name": "Link", "type": DATA_TYPE_TEXT},
-            {"key": "key", "name": "Key", "type": DATA_TYPE_TEXT},
-        ],
-    },
-    "Random Dog Picture": {
-        "name": "Random Dog Picture",
-        "url_template": "https://dog.ceo/api/breeds/image/random",
-        "description": "Get a random dog image URL",
-        "required_params": [],
-        "sensors": [
-            {"key": "message", "name": "Dog Image URL", "type": DATA_TYPE_TEXT},
-            {"key": "status", "name": "Status", "type": DATA_TYPE_TEXT},
-        ],
-    },
-    "Random Cat Picture": {
-        "name": "Random Cat Picture",
-        "url_template": "https://api.thecatapi.com/v1/images/search",
-        "description": "Get a random cat image URL",
-        "required_params": [],
-        "sensors": [
-            {"key": "[0].url", "name": "Cat Image URL", "type": DATA_TYPE_TEXT},
-            {"key": "[0].width", "name": "Width", "type": DATA_TYPE_NUMERIC},
-            {"key": "[0].height", "name": "Height", "type": DATA_TYPE_NUMERIC},
-        ],
-    },
-    "Fox Picture": {
-        "name": "Fox Picture",
-        "url_template": "https://randomfox.ca/floof/",
-        "description": "Get a random fox image URL",
-        "required_params": [],
-        "sensors": [
-            {"key": "image", "name": "Fox Image URL", "type": DATA_TYPE_TEXT},
-            {"key": "link", "name": "Link", "type": DATA_TYPE_TEXT},
-        ],
-    },
-    "Chuck Norris Joke": {
-        "name": "Chuck Norris Joke",
-        "url_template": "https://api.chucknorris.io/jokes/random",
-        "description": "Get a random Chuck Norris joke",
-        "required_params": [],
-        "sensors": [
-            {"key": "value", "name": "Joke", "type": DATA_TYPE_TEXT},
-            {"key": "icon_url", "name": "Icon URL", "type": DATA_TYPE_TEXT},
-            {"key": "url", "name": "Joke URL", "type": DATA_TYPE_TEXT},
-            {"key": "id", "name": "Joke ID", "type": DATA_TYPE_TEXT},
-        ],
-    },
-    "Kanye West Quote": {
-        "name": "Kanye West Quote",
-        "url_template": "https://api.kanye.rest",
-        "description": "Get a random Kanye West quote",
-        "required_params": [],
-        "sensors": [
-            {"key": "quote", "name": "Quote", "type": DATA_TYPE_TEXT},
-        ],
-    },
-    "Random Cat Fact": {
-        "name": "Random Cat Fact",
-        "url_template": "https://catfact.ninja/fact",
-        "description": "Get a random cat fact",
-        "required_params": [],
-        "sensors": [
-            {"key": "fact", "name": "Fact", "type": DATA_TYPE_TEXT},
-            {"key": "length", "name": "Length", "type": DATA_TYPE_NUMERIC},
-        ],
-    },
-    "Random Useless Fact": {
-        "name": "Random Useless Fact",
-        "url_template": "https://uselessfacts.jsph.pl/api/v2/facts/random?language=en",
-        "description": "Get a random useless fact",
-        "required_params": [],
-        "sensors": [
-            {"key": "text", "name": "Fact", "type": DATA_TYPE_TEXT},
-            {"key": "source", "name": "Source", "type": DATA_TYPE_TEXT},
-            {"key": "source_url", "name": "Source URL", "type": DATA_TYPE_TEXT},
-            {"key": "permalink", "name": "Permalink", "type": DATA_TYPE_TEXT},
-        ],
-    },
-    "Random Joke": {
-        "name": "Random Joke",
-        "url_template": "https://official-joke-api.appspot.com/random_joke",
-        "description": "Get a random joke (setup and punchline)",
-        "required_params": [],
-        "sensors": [
-            {"key": "setup", "name": "Setup", "type": DATA_TYPE_TEXT},
-            {"key": "punchline", "name": "Punchline", "type": DATA_TYPE_TEXT},
-            {"key": "type", "name": "Type", "type": DATA_TYPE_TEXT},
-            {"key": "id", "name": "Joke ID", "type": DATA_TYPE_NUMERIC},
-        ],
-    },
-}
+CONF_SEARCH = "search"
+
+
+def _pattern_error(parser: str, pattern: str) -> Optional[str]:
+    """Why a text pattern can't be used, if it can't."""
+    if not pattern:
+        return "The text parser needs a pattern" if parser == PARSER_TEXT else None
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        return f"Invalid regular expression: {e}"
+    return None
+
+
+def _has_request_options(data: Dict[str, Any]) -> bool:
+    """Whether the entry needs the managed request path (only plain paths and a filter work there)."""
+    options = request_options(data)
+    parser = parser_options(data).parser
+    return (
+        options.method != DEFAULT_METHOD or bool(options.headers) or options.auth_type != AUTH_NONE
+        or parser not in (PARSER_AUTO, PARSER_JSON)
+    )
+
+
+def _request_filter_error(data: Dict[str, Any], jq_filter: str) -> Optional[str]:
+    if not _has_request_options(data):
+        return None
+    if not jq_filter or jq_filter == ".":
+        # Raw output runs as a shell command, which can't carry managed auth or headers
+        return "A filter is required when a method, headers or authentication are set"
+    if not is_simple_path(jq_filter):
+        return "Only plain path filters can be combined with request options, authentication or a non-JSON parser"
+    return None
 
 
 class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
@@ -176,9 +162,15 @@ class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
         self._url: Optional[str] = None
         self._raw_output: Optional[str] = None
         self._parsed: Optional[Any] = None
-        self._path: List[str] = []
+        self._index: Optional[PathIndex] = None
+        self._page: int = 0
+        self._selected: List[str] = []
+        self._page_paths: List[str] = []
         self._preset_data: Optional[Dict[str, Any]] = None
         self._preset_params: Dict[str, str] = {}
+        self._preset_search: str = ""
+        self._presets_scanned: bool = False
+        self._request_data: Dict[str, Any] = {}
         self._key_filter: str = ""
         self._last_filter_value: Optional[str] = None
         self._pending_finalize: bool = False
@@ -190,12 +182,23 @@ class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
     async def async_step_preset(self, user_input=None):
         """Handle preset selection."""
         errors = {}
+        # Preset files are rescanned when the dialog opens, not on every search re-render
+        catalog = await async_get_catalog(self.hass, rescan=not self._presets_scanned)
+        self._presets_scanned = True
         if user_input is not None:
             preset_key = user_input.get(CONF_PRESET)
+            search = user_input.get(CONF_SEARCH, "").strip()
+            if search != self._preset_search:
+                # Search changed: re-render the filtered list instead of acting on a stale pick
+                self._preset_search = search
+                preset_key = None
             if preset_key == "custom":
                 return await self.async_step_custom()
-            if preset_key in PRESETS:
-                self._preset_data = PRESETS[preset_key]
+            if preset_key == "webhook":
+                return await self.async_step_webhook()
+            preset = await self.hass.async_add_executor_job(catalog.get, preset_key) if preset_key in catalog else None
+            if preset is not None:
+                self._preset_data = preset
                 self._name = self._preset_data["name"]
                 required_params = self._preset_data.get("required_params", [])
                 if required_params:
@@ -217,22 +220,30 @@ class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
                 if len(sensors) == 1:
                     return self.async_create_entry(title=sensors[0][CONF_NAME], data=sensors[0])
                 return self.async_create_entry(title=self._name, data={"sensors": sensors, "preset": self._preset_data["name"]})
-            errors[CONF_PRESET] = "invalid_preset"
+            if preset_key:
+                errors[CONF_PRESET] = "invalid_preset"
 
-        # Build preset options
+        # Labels come from the catalog's precomputed index; only the search filter runs per render
+        matches = catalog.search(self._preset_search)
         preset_options = {
-            key: f"{preset['name']} - {preset['description']}"
-            for key, preset in PRESETS.items()
+            "custom": "Custom URL (manual configuration)",
+            "webhook": "Webhook (upstream pushes JSON, no polling)",
+            **matches,
         }
-        preset_options["custom"] = "Custom URL (manual configuration)"
-        schema = vol.Schema({vol.Required(CONF_PRESET): vol.In(preset_options)})
+        schema = vol.Schema({
+            vol.Optional(CONF_SEARCH, default=self._preset_search): str,
+            vol.Optional(CONF_PRESET): vol.In(preset_options),
+        })
         return self.async_show_form(
             step_id="preset",
             data_schema=schema,
             errors=errors,
             description_placeholders={
-                "preset_count": str(len(PRESETS)),
-                "test_output": "Choose a popular API preset or create a custom configuration."
+                "preset_count": str(len(catalog)),
+                "test_output": (
+                    f"Choose one of {len(matches)}/{len(catalog)} presets or create a custom configuration. "
+                    "Type in 'search' to narrow the list."
+                ),
             },
         )
 
@@ -304,91 +315,167 @@ class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
         if user_input is not None:
             name = user_input.get(CONF_NAME, DEFAULT_NAME).strip()
             url = user_input.get(CONF_URL, "").strip()
+            headers = user_input.get(CONF_HEADERS, "").strip()
             
             if not url:
                 errors[CONF_URL] = "required"
             else:
+                try:
+                    parse_headers(headers)
+                except ValueError:
+                    errors[CONF_HEADERS] = "Headers must be a JSON object, e.g. {\"Accept\": \"application/json\"}"
+            text_pattern = user_input.get(CONF_TEXT_PATTERN, "")
+            pattern_error = _pattern_error(user_input.get(CONF_PARSER, PARSER_AUTO), text_pattern)
+            if pattern_error:
+                errors[CONF_TEXT_PATTERN] = pattern_error
+            if not errors:
                 self._name = name or DEFAULT_NAME
                 self._url = url
-                
-                # Test URL and fetch sample
-                test_result = await self._async_test_url()
-                if test_result["success"]:
-                    await self._async_fetch_sample()
-                    return await self.async_step_select()
-                else:
-                    errors["base"] = f"Connection failed: {test_result['error']}"
+                self._request_data = {
+                    CONF_METHOD: user_input.get(CONF_METHOD, DEFAULT_METHOD),
+                    CONF_HEADERS: headers,
+                    CONF_AUTH_TYPE: user_input.get(CONF_AUTH_TYPE, AUTH_NONE),
+                    CONF_PARSER: user_input.get(CONF_PARSER, PARSER_AUTO),
+                    CONF_TEXT_PATTERN: text_pattern,
+                }
+                if self._request_data[CONF_AUTH_TYPE] != AUTH_NONE:
+                    return await self.async_step_auth()
+                return await self._async_test_and_select(errors)
 
-        schema = vol.Schema({
+        schema = self._custom_schema()
+
+        return self.async_show_form(
+            step_id="custom",
+            data_schema=schema,
+            errors=errors,
+            description_placeholders={
+                "test_output": "Enter a name and URL for your custom endpoint."
+            }
+        )
+
+    def _custom_schema(self):
+        return vol.Schema({
             vol.Required(CONF_NAME, default=self._name or DEFAULT_NAME): str,
             vol.Required(CONF_URL, default=self._url or ""): str,
+            vol.Optional(CONF_METHOD, default=self._request_data.get(CONF_METHOD, DEFAULT_METHOD)): vol.In(METHODS),
+            vol.Optional(CONF_HEADERS, default=self._request_data.get(CONF_HEADERS, "")): str,
+            vol.Optional(CONF_AUTH_TYPE, default=self._request_data.get(CONF_AUTH_TYPE, AUTH_NONE)): vol.In(AUTH_TYPES),
+            vol.Optional(CONF_PARSER, default=self._request_data.get(CONF_PARSER, PARSER_AUTO)): vol.In(PARSERS),
+            vol.Optional(CONF_TEXT_PATTERN, default=self._request_data.get(CONF_TEXT_PATTERN, "")): str,
         })
 
+    async def async_step_auth(self, user_input=None):
+        """Handle credentials for the selected authentication type."""
+        errors = {}
+        auth_type = self._request_data[CONF_AUTH_TYPE]
+        fields = AUTH_FIELDS[auth_type]
+
+        if user_input is not None:
+            for key, _ in fields:
+                if key in AUTH_REQUIRED and not str(user_input.get(key, "")).strip():
+                    errors[key] = "required"
+            if not errors:
+                self._request_data.update({key: str(user_input.get(key, "")).strip() for key, _ in fields})
+                return await self._async_test_and_select(errors)
+
+        schema_fields = {}
+        for key, default in fields:
+            marker = vol.Required if key in AUTH_REQUIRED else vol.Optional
+            schema_fields[marker(key, default=self._request_data.get(key, default))] = str
+        return self.async_show_form(
+            step_id="auth",
+            data_schema=vol.Schema(schema_fields),
+            errors=errors,
+            description_placeholders={
+                "test_output": (
+                    f"Credentials for {auth_type}. Tokens are fetched once, cached until shortly before "
+                    "they expire and shared by every MyCurl entry using the same credentials."
+                )
+            },
+        )
+
+    async def _async_test_and_select(self, errors):
+        """Test the URL with the configured request options and move on to key selection."""
+        test_result = await self._async_test_url()
+        if test_result["success"]:
+            await self._async_fetch_sample()
+            return await self.async_step_select()
+        errors["base"] = f"Connection failed: {test_result['error']}"
         return self.async_show_form(
             step_id="custom",
-            data_schema=schema,
+            data_schema=self._custom_schema(),
             errors=errors,
             description_placeholders={
                 "test_output": "Enter a name and URL for your custom endpoint."
             }
         )
 
-    async def async_step_select(self, user_input=None):
-        """Handle key selection for custom endpoints."""
+    async def async_step_webhook(self, user_input=None):
+        """Handle webhook (push) configuration."""
         errors = {}
-        key_filter = self._key_filter
-        scan_interval = 300
-        jq_filter = ""
 
-        # Determine current container and build key list
-        current_container = self._resolve_path(self._path) if self._path else self._parsed
-        keys = []
-        key_labels = {}
-        auto_numeric = False
-        auto_key = None
-        preview_value = None
-
-        if isinstance(current_container, dict):
-            raw_keys = [str(k) for k in list(current_container.keys())]
-            if key_filter:
-                raw_keys = [k for k in raw_keys if key_filter.lower() in k.lower()]
-            raw_keys = raw_keys[:150]
-
-            # Sort keys: dicts first, then lists, then primitives
-            def sort_key(k: str):
-                v = current_container.get(k)
-                if isinstance(v, dict):
-                    return (0, k.lower())
-                elif isinstance(v, list):
-                    return (1, k.lower())
-                else:
-                    return (2, k.lower())
-
-            raw_keys.sort(key=sort_key)
+        if user_input is not None:
+            name = user_input.get(CONF_NAME, DEFAULT_NAME).strip() or DEFAULT_NAME
+            filters = [f.strip() for f in user_input.get(CONF_JQ_FILTER, "").split(",") if f.strip()]
+            filters = [f if f.startswith(".") else f".{f}" for f in filters]
+            if not filters:
+                errors[CONF_JQ_FILTER] = "required"
+            else:
+                data_type = user_input.get(CONF_DATA_TYPE, DATA_TYPE_TEXT)
+                sensors = [
+                    {
+                        CONF_NAME: name if len(filters) == 1 else f"{name} - {jq_filter.lstrip('.')}",
+                        CONF_JQ_FILTER: jq_filter,
+                        CONF_DATA_TYPE: data_type,
+                    }
+                    for jq_filter in filters
+                ]
+                webhook_id = webhook.async_generate_id()
+                data = {
+                    CONF_WEBHOOK_ID: webhook_id,
+                    CONF_WEBHOOK_SECRET: user_input.get(CONF_WEBHOOK_SECRET, "").strip(),
+                    CONF_DEBOUNCE: user_input.get(CONF_DEBOUNCE, DEFAULT_DEBOUNCE),
+                    "sensors": sensors,
+                }
+                async_notify_webhook_url(self.hass, name, webhook_id, bool(data[CONF_WEBHOOK_SECRET]))
+                return self.async_create_entry(title=name, data=data)
 
-            for k in raw_keys:
-                val = current_container.get(k)
-                summary = self._summarize_value(val)
-                icon = "📁" if isinstance(val, dict) else ("📋" if isinstance(val, list) else "🔢" if isinstance(val, (int, float)) else "📝")
-                key_labels[k] = f"{icon} {k} = {summary}"
+        schema = vol.Schema({
+            vol.Required(CONF_NAME, default=self._name or DEFAULT_NAME): str,
+            vol.Required(CONF_JQ_FILTER, default=""): str,
+            vol.Optional(CONF_DATA_TYPE, default=DATA_TYPE_TEXT): vol.In([DATA_TYPE_NUMERIC, DATA_TYPE_TEXT]),
+            vol.Optional(CONF_WEBHOOK_SECRET, default=""): str,
+            vol.Optional(CONF_DEBOUNCE, default=DEFAULT_DEBOUNCE): vol.All(vol.Coerce(float), vol.Range(min=0, max=300)),
+        })
 
-                # Auto-detect single numeric value
-                if len(raw_keys) == 1 and isinstance(val, (int, float)):
-                    auto_numeric = True
-                    auto_key = k
-                    preview_value = val
+        return self.async_show_form(
+            step_id="webhook",
+            data_schema=schema,
+            errors=errors,
+            description_placeholders={
+                "test_output": (
+                    "Enter one or more filters (comma separated), e.g. .temperature, .status.state. "
+                    "If a secret is set, requests must carry an HMAC-SHA256 of the body in X-MyCurl-Signature."
+                )
+            }
+        )
 
-            keys = raw_keys
+    async def async_step_select(self, user_input=None):
+        """Handle key selection for custom endpoints."""
+        errors = {}
+        scan_interval = 300
+        jq_filter = ""
+        index = self._index or PathIndex(None)
 
-        # Add navigation option if we're in a nested path
-        if self._path:
-            keys = [".."] + keys
-            key_labels[".."] = "⬆️ .. (go up)"
+        # Auto-detect a document that is just one numeric value
+        auto_numeric = len(index) == 1 and index.entries[0].type == "number"
+        auto_key = index.entries[0].path if auto_numeric else None
+        preview_value = index.entries[0].preview if auto_numeric else None
 
         if user_input is not None:
             # Handle auto-numeric case
             if auto_numeric and auto_key and not user_input.get(CONF_JQ_FILTER):
-                jq_filter = f".{auto_key}"
+                jq_filter = auto_key
                 data_type = DATA_TYPE_NUMERIC
                 scan_interval = user_input.get(CONF_SCAN_INTERVAL, 300)
             else:
@@ -396,28 +483,45 @@ class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
                 key_select = user_input.get(CONF_KEY_SELECT)
                 data_type = user_input.get(CONF_DATA_TYPE, DATA_TYPE_TEXT)
                 scan_interval = user_input.get(CONF_SCAN_INTERVAL, 300)
-                key_filter = user_input.get("key_filter", "").strip()
-                self._key_filter = key_filter
-
-                # Handle navigation
-                if key_select == "..":
-                    if self._path:
-                        self._path.pop()
+                key_filter = user_input.get(CONF_KEY_FILTER, "").strip()
+                page = max(user_input.get(CONF_PAGE, 1), 1) - 1
+                numeric_under = user_input.get(CONF_NUMERIC_UNDER, "").strip()
+
+                # Ticked keys are remembered across searches and pages; unticking on this page drops them
+                page_paths = set(self._page_paths)
+                ticked = user_input.get(CONF_KEY_MULTI, [])
+                self._selected = [p for p in self._selected if p not in page_paths] + list(ticked)
+
+                # Browsing: a new search starts at page 1, a new page just re-renders
+                if key_filter != self._key_filter:
+                    self._key_filter = key_filter
+                    self._page = 0
                     return await self.async_step_select()
-                elif key_select and key_select in current_container:
-                    target = current_container[key_select]
-                    if isinstance(target, dict):
-                        # Navigate deeper
-                        self._path.append(key_select)
-                        return await self.async_step_select()
-                    else:
-                        # Select this value
-                        jq_filter = self._compose_filter(self._path + [key_select])
-                        self._pending_finalize = True
+                if page != self._page and not key_select:
+                    self._page = page
+                    return await self.async_step_select()
+                if key_select:
+                    jq_filter = key_select
+                    self._pending_finalize = True
+                elif self._selected or numeric_under:
+                    # Bulk: one entry, one coordinator, one fetch per interval for every picked leaf
+                    paths = list(self._selected)
+                    if numeric_under:
+                        paths += [entry.path for entry in index.numeric_under(numeric_under)]
+                    paths = list(dict.fromkeys(paths))
+                    if paths:
+                        return self._create_bulk_entry(index, paths, scan_interval)
+                    errors[CONF_NUMERIC_UNDER] = "No numeric values under this path"
 
             # Finalize if we have a filter
             # Only allow valid jq_filter (not empty or just '.')
-            if jq_filter and jq_filter != ".":
+            if errors:
+                pass  # Fall through to re-render with the error
+            elif jq_filter and jq_filter != "." and self._has_request_options() and not is_simple_path(jq_filter):
+                errors[CONF_JQ_FILTER] = (
+                    "Only plain path filters can be combined with request options, authentication or a non-JSON parser"
+                )
+            elif jq_filter and jq_filter != ".":
                 value_preview = self._apply_filter(jq_filter)
                 if value_preview is not None:
                     self._last_filter_value = str(value_preview)[:400]
@@ -428,11 +532,15 @@ class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
                         CONF_JQ_FILTER: jq_filter,
                         CONF_DATA_TYPE: data_type,
                         CONF_SCAN_INTERVAL: scan_interval,
+                        **self._request_data,
                     }
                     data[CONF_CURL_COMMAND] = build_curl_command(self._url, jq_filter)
                     return self.async_create_entry(title=data[CONF_NAME], data=data)
                 else:
                     errors[CONF_JQ_FILTER] = "Filter returned no value"
+            elif self._has_request_options():
+                # Raw output runs as a shell command, which can't carry managed auth or headers
+                errors[CONF_JQ_FILTER] = "A filter is required when a method, headers or authentication are set"
             elif not jq_filter or jq_filter == ".":
                 # No filter: treat as raw output, do not pass jq_filter
                 data = {
@@ -445,6 +553,18 @@ class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
                 data[CONF_CURL_COMMAND] = build_curl_command(self._url, "")
                 return self.async_create_entry(title=data[CONF_NAME], data=data)
 
+        # Current page of the flattened index
+        results, total = index.search(self._key_filter, self._page, KEY_PAGE_SIZE)
+        pages = max((total + KEY_PAGE_SIZE - 1) // KEY_PAGE_SIZE, 1)
+        if self._page >= pages:
+            self._page = pages - 1
+            results, total = index.search(self._key_filter, self._page, KEY_PAGE_SIZE)
+        key_labels = {
+            entry.path: f"{TYPE_ICONS.get(entry.type, '📝')} {entry.path} = {entry.preview}"
+            for entry in results
+        }
+        self._page_paths = list(key_labels)
+
         # Build form schema
         schema_fields = {}
 
@@ -461,13 +581,21 @@ class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
                 int, vol.Range(min=5, max=3600)
             )
             schema_fields[vol.Optional(CONF_JQ_FILTER, default=jq_filter)] = str
-            schema_fields[vol.Optional("key_filter", default=key_filter)] = str
+            schema_fields[vol.Optional(CONF_KEY_FILTER, default=self._key_filter)] = str
+            if pages > 1:
+                schema_fields[vol.Optional(CONF_PAGE, default=self._page + 1)] = vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=pages)
+                )
 
-            if keys:
+            if key_labels:
                 schema_fields[vol.Optional(CONF_KEY_SELECT, default="")] = vol.In({
                     "": "Select a key...",
                     **key_labels
                 })
+                schema_fields[vol.Optional(
+                    CONF_KEY_MULTI, default=[p for p in self._selected if p in key_labels]
+                )] = cv.multi_select(key_labels)
+            schema_fields[vol.Optional(CONF_NUMERIC_UNDER, default="")] = str
 
         schema = vol.Schema(schema_fields)
 
@@ -485,9 +613,16 @@ class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
         elif self._raw_output:
             preview_lines.append(f"📄 Raw response: {self._raw_output[:400]}")
 
-        # Show current path
-        if self._path:
-            preview_lines.append(f"\n📂 Current path: {'.'.join(self._path)}")
+        # Show search position
+        if len(index):
+            scope = f" matching '{self._key_filter}'" if self._key_filter else ""
+            preview_lines.append(
+                f"\n🔎 {total} of {len(index)}{'+' if index.truncated else ''} values{scope} "
+                f"(page {self._page + 1}/{pages})"
+            )
+
+        if self._selected:
+            preview_lines.append(f"\n☑️ {len(self._selected)} keys ticked for bulk creation")
 
         # Show preview of selected value
         if self._last_filter_value is not None:
@@ -497,14 +632,16 @@ class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
         if auto_numeric and auto_key and preview_value is not None:
             preview_lines.append(f"\n🎯 Auto-detected: {auto_key} = {preview_value} (numeric)")
 
-        # Show navigation tips
+        # Show search tips
         if not auto_numeric:
             preview_lines.append("\n💡 Tips:")
-            preview_lines.append("• Select 📁 folders to navigate deeper")
             preview_lines.append("• Select 🔢📝 values to create sensor")
-            preview_lines.append("• Use 'key_filter' to search keys")
-            if self._path:
-                preview_lines.append("• Select ⬆️ .. to go back up")
+            preview_lines.append("• Tick several keys (across pages) to create them all in one entry with one fetch")
+            preview_lines.append("• Or set 'numeric_under' to a path (e.g. '.' or .stats) to add every number below it")
+            preview_lines.append("• Use 'key_filter' to search all paths (e.g. 'temp', or fuzzy 'rsltq')")
+            preview_lines.append("• Path patterns work too: results[*].price, .data.items[3]")
+            if pages > 1:
+                preview_lines.append("• Change 'page' to browse more results")
 
         return self.async_show_form(
             step_id="select",
@@ -515,6 +652,29 @@ class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
             }
         )
 
+    def _create_bulk_entry(self, index: PathIndex, paths: List[str], scan_interval: int):
+        """Create one multi-sensor entry for many leaves of the same endpoint."""
+        sensors = []
+        for path in paths:
+            data_type = DATA_TYPE_NUMERIC if index.type_of(path) == "number" else DATA_TYPE_TEXT
+            sensors.append({
+                CONF_NAME: f"{self._name or DEFAULT_NAME} - {path.lstrip('.')}",
+                CONF_URL: self._url,
+                CONF_JQ_FILTER: path,
+                CONF_DATA_TYPE: data_type,
+                CONF_SCAN_INTERVAL: scan_interval,
+                CONF_CURL_COMMAND: build_curl_command(self._url, path),
+            })
+        if len(sensors) == 1:
+            return self.async_create_entry(title=sensors[0][CONF_NAME], data={**sensors[0], **self._request_data})
+        return self.async_create_entry(title=self._name or DEFAULT_NAME, data={"sensors": sensors, **self._request_data})
+
+    def _has_request_options(self) -> bool:
+        return _has_request_options(self._request_data)
+
+    async def _async_request_headers(self) -> Dict[str, str]:
+        return await async_request_headers(self.hass, request_options(self._request_data))
+
     async def _async_test_url(self) -> Dict[str, Any]:
         """Test if URL is accessible."""
         if not self._url:
@@ -522,8 +682,11 @@ class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
 
         try:
             timeout = aiohttp.ClientTimeout(total=10)
+            headers = await self._async_request_headers()
             async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(self._url) as response:
+                async with session.request(
+                    request_options(self._request_data).method, self._url, headers=headers
+                ) as response:
                     if response.status == 200:
                         return {"success": True, "status": response.status}
                     else:
@@ -540,19 +703,21 @@ class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
 
         try:
             timeout = aiohttp.ClientTimeout(total=10)
+            headers = await self._async_request_headers()
             async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(self._url) as response:
+                async with session.request(
+                    request_options(self._request_data).method, self._url, headers=headers
+                ) as response:
                     if response.status == 200:
                         content_type = response.headers.get('content-type', '')
-                        if 'application/json' in content_type:
-                            self._parsed = await response.json()
+                        body = await response.read()
+                        # Same parser the coordinator will use, so CSV/XML/text samples get a path index too
+                        try:
+                            self._parsed = parse_body(parser_options(self._request_data), body, content_type)
                             self._raw_output = json.dumps(self._parsed, indent=2)
-                        else:
-                            self._raw_output = await response.text()
-                            try:
-                                self._parsed = json.loads(self._raw_output)
-                            except json.JSONDecodeError:
-                                self._parsed = None
+                        except ParseError:
+                            self._parsed = None
+                            self._raw_output = body.decode(response.charset or "utf-8", errors="replace")
                     else:
                         self._raw_output = f"HTTP {response.status}"
                         self._parsed = None
@@ -560,8 +725,12 @@ class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
             self._raw_output = f"Error: {str(e)}"
             self._parsed = None
         
-        # Reset navigation path
-        self._path = []
+        # Flatten once; every search and page of the select step reads from this index
+        self._index = PathIndex(self._parsed) if self._parsed is not None else None
+        self._key_filter = ""
+        self._page = 0
+        self._page_paths = []
+        self._selected = []
 
     def _get_sensor_preview(self, key: str) -> str:
         """Get preview value for a sensor key."""
@@ -577,65 +746,14 @@ class MyCurlConfigFlow(config_entries.ConfigFlow, domain="mycurl"):
             return "Error"
 
     def _apply_filter(self, jq_filter: str) -> Any:
-        """Apply a simple dot-notation filter to parsed JSON."""
+        """Apply a dot-notation filter (indices and wildcards allowed) to parsed JSON."""
         if not jq_filter or not self._parsed:
             return None
             
         if not jq_filter.startswith('.'):
             return None
 
-        current = self._parsed
-        parts = jq_filter[1:].split('.') if jq_filter != '.' else []
-        
-        for part in parts:
-            if not part:
-                continue
-                
-            # Handle array indices
-            if part.isdigit():
-                part = int(part)
-            
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            elif isinstance(current, list) and isinstance(part, int) and 0 <= part < len(current):
-                current = current[part]
-            else:
-                return None
-                
-        return current
-
-    def _resolve_path(self, path: List[str]) -> Any:
-        """Resolve a path in the parsed JSON."""
-        node = self._parsed
-        for p in path:
-            if isinstance(node, dict) and p in node:
-                node = node[p]
-            else:
-                return None
-        return node
-
-    def _compose_filter(self, path: List[str]) -> str:
-        """Compose a jq filter from a path."""
-        if not path:
-            return "."
-        return "." + ".".join(path)
-
-    def _summarize_value(self, val: Any) -> str:
-        """Create a short summary of a value."""
-        if isinstance(val, (int, float, bool)):
-            return str(val)
-        elif isinstance(val, str):
-            return f'"{val[:30]}{"…" if len(val) > 30 else ""}"'
-        elif isinstance(val, list):
-            return f"Array[{len(val)}]"
-        elif isinstance(val, dict):
-            keys = list(val.keys())[:3]
-            more = "…" if len(val.keys()) > 3 else ""
-            return f"{{{', '.join(keys)}{more}}}"
-        elif val is None:
-            return "null"
-        else:
-            return str(val)[:30]
+        return compile_filter(jq_filter)(self._parsed)
 
     @staticmethod
     def async_get_options_flow(config_entry):
@@ -649,6 +767,7 @@ class MyCurlOptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry):
         """Initialize options flow."""
         super().__init__()
+        self._options = {}
 
     async def async_step_init(self, user_input=None):
         """Handle options flow."""
@@ -656,7 +775,63 @@ class MyCurlOptionsFlowHandler(config_entries.OptionsFlow):
         data = {**self.config_entry.data, **self.config_entry.options}
         
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            filter_error = None
+            if CONF_JQ_FILTER in user_input:
+                # Same rule as setup: a jq program or raw output would silently drop auth/headers/parser
+                filter_error = _request_filter_error({**data, **user_input}, user_input[CONF_JQ_FILTER].strip())
+            if filter_error:
+                errors[CONF_JQ_FILTER] = filter_error
+                data = {**data, **user_input}
+            else:
+                self._options = user_input
+                return await self._async_next_step()
+
+        default_interval = data.get(
+            CONF_SCAN_INTERVAL, 
+            int(DEFAULT_SCAN_INTERVAL.total_seconds()) if hasattr(DEFAULT_SCAN_INTERVAL, 'total_seconds') else 300
+        )
+        if data.get(CONF_WEBHOOK_ID):
+            # Push entries: only the burst debounce is tunable. Opening options re-posts the URL notice
+            async_notify_webhook_url(
+                self.hass, self.config_entry.title, data[CONF_WEBHOOK_ID], bool(data.get(CONF_WEBHOOK_SECRET))
+            )
+            return self.async_show_form(
+                step_id="init",
+                data_schema=vol.Schema({
+                    vol.Optional(CONF_DEBOUNCE, default=data.get(CONF_DEBOUNCE, DEFAULT_DEBOUNCE)): vol.All(
+                        vol.Coerce(float), vol.Range(min=0, max=300)
+                    ),
+                    vol.Optional(CONF_HISTORY_SIZE, default=data.get(CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE)): vol.All(
+                        int, vol.Range(min=0, max=MAX_HISTORY_SIZE)
+                    ),
+                    vol.Optional(CONF_HISTORY_SENSORS, default=list(data.get(CONF_HISTORY_SENSORS, []))): cv.multi_select(STATS),
+                }),
+                errors=errors
+            )
+        if isinstance(data.get("sensors"), list) and data["sensors"]:
+            # Multi-sensor entries share one endpoint and interval
+            first = data["sensors"][0]
+            return self.async_show_form(
+                step_id="init",
+                data_schema=vol.Schema({
+                    vol.Required(CONF_URL, default=data.get(CONF_URL) or first.get(CONF_URL, "")): str,
+                    vol.Optional(CONF_SCAN_INTERVAL, default=data.get(
+                        CONF_SCAN_INTERVAL, first.get(CONF_SCAN_INTERVAL, default_interval)
+                    )): vol.All(int, vol.Range(min=5, max=3600)),
+                    vol.Optional(CONF_COMPRESSION, default=data.get(CONF_COMPRESSION, DEFAULT_COMPRESSION)): bool,
+                    vol.Optional(CONF_LEAF_ONLY, default=data.get(CONF_LEAF_ONLY, False)): bool,
+                    vol.Optional(CONF_MIN_REFRESH_AGE, default=data.get(CONF_MIN_REFRESH_AGE, DEFAULT_MIN_REFRESH_AGE)): vol.All(
+                        vol.Coerce(float), vol.Range(min=0, max=3600)
+                    ),
+                    vol.Optional(CONF_PAGINATION, default=data.get(CONF_PAGINATION, PAGINATION_NONE)): vol.In(PAGINATION_MODES),
+                    vol.Optional(CONF_PARSER, default=data.get(CONF_PARSER, PARSER_AUTO)): vol.In(PARSERS),
+                    vol.Optional(CONF_HISTORY_SIZE, default=data.get(CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE)): vol.All(
+                        int, vol.Range(min=0, max=MAX_HISTORY_SIZE)
+                    ),
+                    vol.Optional(CONF_HISTORY_SENSORS, default=list(data.get(CONF_HISTORY_SENSORS, []))): cv.multi_select(STATS),
+                }),
+                errors=errors
+            )
 
         schema = vol.Schema({
             vol.Required(CONF_NAME, default=data.get(CONF_NAME, DEFAULT_NAME)): str,
@@ -665,14 +840,98 @@ class MyCurlOptionsFlowHandler(config_entries.OptionsFlow):
             vol.Optional(CONF_DATA_TYPE, default=data.get(CONF_DATA_TYPE, DATA_TYPE_TEXT)): vol.In([
                 DATA_TYPE_NUMERIC, DATA_TYPE_TEXT
             ]),
-            vol.Optional(CONF_SCAN_INTERVAL, default=data.get(
-                CONF_SCAN_INTERVAL, 
-                int(DEFAULT_SCAN_INTERVAL.total_seconds()) if hasattr(DEFAULT_SCAN_INTERVAL, 'total_seconds') else 300
-            )): vol.All(int, vol.Range(min=5, max=3600)),
+            vol.Optional(CONF_SCAN_INTERVAL, default=default_interval): vol.All(int, vol.Range(min=5, max=3600)),
+            vol.Optional(CONF_COMPRESSION, default=data.get(CONF_COMPRESSION, DEFAULT_COMPRESSION)): bool,
+            vol.Optional(CONF_LEAF_ONLY, default=data.get(CONF_LEAF_ONLY, False)): bool,
+            vol.Optional(CONF_MIN_REFRESH_AGE, default=data.get(CONF_MIN_REFRESH_AGE, DEFAULT_MIN_REFRESH_AGE)): vol.All(
+                vol.Coerce(float), vol.Range(min=0, max=3600)
+            ),
+            vol.Optional(CONF_PAGINATION, default=data.get(CONF_PAGINATION, PAGINATION_NONE)): vol.In(PAGINATION_MODES),
+            vol.Optional(CONF_PARSER, default=data.get(CONF_PARSER, PARSER_AUTO)): vol.In(PARSERS),
+            vol.Optional(CONF_HISTORY_SIZE, default=data.get(CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE)): vol.All(
+                int, vol.Range(min=0, max=MAX_HISTORY_SIZE)
+            ),
+            vol.Optional(CONF_HISTORY_SENSORS, default=list(data.get(CONF_HISTORY_SENSORS, []))): cv.multi_select(STATS),
         })
 
         return self.async_show_form(
             step_id="init",
             data_schema=schema,
             errors=errors
+        )
+
+    async def _async_next_step(self):
+        """Ask for pagination/parser details when those modes need them, then save."""
+        if self._options.get(CONF_PAGINATION, PAGINATION_NONE) != PAGINATION_NONE and CONF_MAX_PAGES not in self._options:
+            return await self.async_step_pagination()
+        parser = self._options.get(CONF_PARSER)
+        if (
+            (parser == PARSER_CSV and CONF_CSV_HEADER not in self._options)
+            or (parser == PARSER_TEXT and CONF_TEXT_GROUP not in self._options)
+        ):
+            return await self.async_step_parser()
+        return self.async_create_entry(title="", data=self._options)
+
+    async def async_step_parser(self, user_input=None):
+        """CSV layout or the text pattern to extract with."""
+        errors = {}
+        data = {**self.config_entry.data, **self.config_entry.options}
+        parser = self._options[CONF_PARSER]
+
+        if user_input is not None:
+            pattern_error = _pattern_error(parser, user_input.get(CONF_TEXT_PATTERN, "")) if parser == PARSER_TEXT else None
+            if pattern_error:
+                errors[CONF_TEXT_PATTERN] = pattern_error
+            else:
+                self._options.update(user_input)
+                return await self._async_next_step()
+
+        if parser == PARSER_CSV:
+            schema = vol.Schema({
+                vol.Optional(CONF_CSV_DELIMITER, default=data.get(CONF_CSV_DELIMITER, "")): str,
+                vol.Optional(CONF_CSV_HEADER, default=data.get(CONF_CSV_HEADER, True)): bool,
+                vol.Optional(CONF_CSV_KEY_COLUMN, default=data.get(CONF_CSV_KEY_COLUMN, "")): str,
+            })
+        else:
+            schema = vol.Schema({
+                vol.Required(CONF_TEXT_PATTERN, default=data.get(CONF_TEXT_PATTERN, "")): str,
+                vol.Optional(CONF_TEXT_GROUP, default=str(data.get(CONF_TEXT_GROUP, ""))): str,
+            })
+        return self.async_show_form(step_id="parser", data_schema=schema, errors=errors)
+
+    async def async_step_pagination(self, user_input=None):
+        """Where the items live and how to reach the next page."""
+        errors = {}
+        data = {**self.config_entry.data, **self.config_entry.options}
+
+        if user_input is not None:
+            paths = [user_input.get(key) for key in (CONF_ITEMS_PATH, CONF_NEXT_PATH, CONF_CURSOR_PATH, CONF_TOTAL_PATH)]
+            mode = self._options[CONF_PAGINATION]
+            if any(path and not is_simple_path(path) for path in paths):
+                errors["base"] = "Pagination paths must be plain paths such as .data.items"
+            elif mode == PAGINATION_CURSOR and not user_input.get(CONF_CURSOR_PATH):
+                errors[CONF_CURSOR_PATH] = "required"
+            else:
+                self._options.update(user_input)
+                return await self._async_next_step()
+
+        return self.async_show_form(
+            step_id="pagination",
+            data_schema=vol.Schema({
+                vol.Optional(CONF_ITEMS_PATH, default=data.get(CONF_ITEMS_PATH, "")): str,
+                vol.Optional(CONF_NEXT_PATH, default=data.get(CONF_NEXT_PATH, "")): str,
+                vol.Optional(CONF_CURSOR_PATH, default=data.get(CONF_CURSOR_PATH, "")): str,
+                vol.Optional(CONF_CURSOR_PARAM, default=data.get(CONF_CURSOR_PARAM, "")): str,
+                vol.Optional(CONF_PAGE_PARAM, default=data.get(CONF_PAGE_PARAM, "")): str,
+                vol.Optional(CONF_START_PAGE, default=data.get(CONF_START_PAGE, 1)): vol.All(int, vol.Range(min=0)),
+                vol.Optional(CONF_LIMIT, default=data.get(CONF_LIMIT, 0)): vol.All(int, vol.Range(min=0)),
+                vol.Optional(CONF_TOTAL_PATH, default=data.get(CONF_TOTAL_PATH, "")): str,
+                vol.Optional(CONF_MAX_PAGES, default=data.get(CONF_MAX_PAGES, DEFAULT_MAX_PAGES)): vol.All(
+                    int, vol.Range(min=1, max=1000)
+                ),
+                vol.Optional(CONF_MAX_BYTES, default=data.get(CONF_MAX_BYTES, DEFAULT_MAX_BYTES)): vol.All(
+                    int, vol.Range(min=1024)
+                ),
+            }),
+            errors=errors
         )
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""Diagnostics support for MyCurl."""
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import DOMAIN
+
+TO_REDACT = {"webhook_id", "webhook_secret", "api_key", "password", "token", "client_secret", "headers"}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+	"""Return entry config and per-endpoint transfer statistics."""
+	runtime = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+	diagnostics: dict[str, Any] = {
+		"data": async_redact_data(dict(entry.data), TO_REDACT),
+		"options": async_redact_data(dict(entry.options), TO_REDACT),
+	}
+	if runtime is not None:
+		coordinator = runtime["coordinator"]
+		diagnostics["transfer"] = coordinator.transfer_stats.as_dict()
+		diagnostics["compression"] = coordinator.compression
+		diagnostics["leaf_only"] = coordinator.leaf_only
+	return diagnostics
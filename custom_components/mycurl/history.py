@@ -0,0 +1,125 @@
+"""In-memory rolling history for numeric MyCurl sensors.
+
+A fixed-size ring of (timestamp, value) samples per sensor, kept in two flat
+float arrays, with running aggregates so each update is O(1) (min/max amortised
+through monotonic index queues). Nothing here touches the recorder.
+"""
+import time
+from array import array
+from collections import deque
+from typing import Dict, Optional
+
+CONF_HISTORY_SIZE = "history_size"
+CONF_HISTORY_SENSORS = "history_sensors"
+DEFAULT_HISTORY_SIZE = 0
+MAX_HISTORY_SIZE = 10000
+
+STAT_RATE = "rate"
+STAT_DELTA = "delta"
+STAT_MEAN = "mean"
+STAT_MIN = "min"
+STAT_MAX = "max"
+STATS = [STAT_RATE, STAT_DELTA, STAT_MEAN, STAT_MIN, STAT_MAX]
+
+
+class RollingWindow:
+	"""The last `size` samples of one sensor.
+
+	rate is units per second between the oldest and newest sample, delta the
+	change since the previous sample, mean/min/max cover the whole window.
+	"""
+
+	__slots__ = ("size", "_times", "_values", "_count", "_seq", "_sum", "_min", "_max")
+
+	def __init__(self, size: int):
+		self.size = size
+		self._times = array("d", bytes(8 * size))
+		self._values = array("d", bytes(8 * size))
+		self._count = 0
+		# Total samples ever added; slot of sample n is n % size
+		self._seq = 0
+		self._sum = 0.0
+		# Sequence numbers of candidate minima/maxima, values monotonic from left to right
+		self._min: deque = deque()
+		self._max: deque = deque()
+
+	def __len__(self) -> int:
+		return self._count
+
+	def add(self, value: float, now: Optional[float] = None) -> None:
+		"""Record a sample; one not newer than the last sample is a repeat and ignored."""
+		now = time.monotonic() if now is None else now
+		if self._count and now <= self._times[self._at(self._seq - 1)]:
+			return
+		seq = self._seq
+		slot = seq % self.size
+		if self._count == self.size:
+			self._sum -= self._values[slot]
+		else:
+			self._count += 1
+		self._times[slot] = now
+		self._values[slot] = value
+		if slot == self.size - 1:
+			# Re-sum once per lap so float drift in the running total can't build up
+			self._sum = sum(self._values[:self._count])
+		else:
+			self._sum += value
+		self._seq = seq + 1
+
+		oldest = self._seq - self._count
+		values, size = self._values, self.size
+		low, high = self._min, self._max
+		while low and low[0] < oldest:
+			low.popleft()
+		while low and values[low[-1] % size] >= value:
+			low.pop()
+		low.append(seq)
+		while high and high[0] < oldest:
+			high.popleft()
+		while high and values[high[-1] % size] <= value:
+			high.pop()
+		high.append(seq)
+
+	def _at(self, seq: int) -> int:
+		return seq % self.size
+
+	@property
+	def last(self) -> Optional[float]:
+		return self._values[self._at(self._seq - 1)] if self._count else None
+
+	@property
+	def delta(self) -> Optional[float]:
+		if self._count < 2:
+			return None
+		return self._values[self._at(self._seq - 1)] - self._values[self._at(self._seq - 2)]
+
+	@property
+	def rate(self) -> Optional[float]:
+		if self._count < 2:
+			return None
+		newest, oldest = self._at(self._seq - 1), self._at(self._seq - self._count)
+		elapsed = self._times[newest] - self._times[oldest]
+		if elapsed <= 0:
+			return None
+		return (self._values[newest] - self._values[oldest]) / elapsed
+
+	@property
+	def mean(self) -> Optional[float]:
+		return self._sum / self._count if self._count else None
+
+	@property
+	def min(self) -> Optional[float]:
+		return self._values[self._at(self._min[0])] if self._count else None
+
+	@property
+	def max(self) -> Optional[float]:
+		return self._values[self._at(self._max[0])] if self._count else None
+
+	def stat(self, name: str) -> Optional[float]:
+		value = getattr(self, name)
+		return round(value, 6) if value is not None else None
+
+	def as_dict(self) -> Dict[str, Optional[float]]:
+		stats: Dict[str, Optional[float]] = {name: self.stat(name) for name in STATS}
+		stats["samples"] = self._count
+		return stats
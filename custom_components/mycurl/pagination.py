@@ -0,0 +1,283 @@
+"""Paginated endpoints: follow links/cursors or fetch numbered pages, merged into one array."""
+import asyncio
+import logging
+import math
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from yarl import URL
+
+from .paths import compile_filter, has_wildcard, parse_path, resolve
+from .request import ResponseTooLarge
+
+_LOGGER = logging.getLogger(__name__)
+
+CONF_PAGINATION = "pagination"
+CONF_ITEMS_PATH = "items_path"
+CONF_NEXT_PATH = "next_path"
+CONF_CURSOR_PATH = "cursor_path"
+CONF_CURSOR_PARAM = "cursor_param"
+CONF_PAGE_PARAM = "page_param"
+CONF_START_PAGE = "start_page"
+CONF_LIMIT = "limit"
+CONF_TOTAL_PATH = "total_path"
+CONF_MAX_PAGES = "max_pages"
+CONF_MAX_BYTES = "max_bytes"
+
+PAGINATION_NONE = "none"
+PAGINATION_LINK = "link"
+PAGINATION_CURSOR = "cursor"
+PAGINATION_PAGE = "page"
+PAGINATION_OFFSET = "offset"
+PAGINATION_MODES = [PAGINATION_NONE, PAGINATION_LINK, PAGINATION_CURSOR, PAGINATION_PAGE, PAGINATION_OFFSET]
+
+DEFAULT_MAX_PAGES = 10
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_CURSOR_PARAM = "cursor"
+DEFAULT_PAGE_PARAM = "page"
+DEFAULT_OFFSET_PARAM = "offset"
+# Pages fetched at once when page numbers/offsets are predictable
+CONCURRENCY = 4
+
+# fetch_page(url, max_bytes) -> (parsed document, response headers, decoded size)
+PageFetcher = Callable[[str, int], Awaitable[Tuple[Any, Any, int]]]
+
+
+class Pagination(NamedTuple):
+	"""How to walk one endpoint's pages.
+
+	`page_param` is the page number (page mode) or offset (offset mode) query
+	parameter; `total_path` points at the total page count (page) or total item
+	count (offset) and, when present, lets the remaining pages be fetched concurrently.
+	"""
+
+	mode: str
+	items_path: str = ""
+	next_path: str = ""
+	cursor_path: str = ""
+	cursor_param: str = DEFAULT_CURSOR_PARAM
+	page_param: str = DEFAULT_PAGE_PARAM
+	start_page: int = 1
+	limit: int = 0
+	total_path: str = ""
+	max_pages: int = DEFAULT_MAX_PAGES
+	max_bytes: int = DEFAULT_MAX_BYTES
+
+
+def pagination_options(data: Dict[str, Any]) -> Optional[Pagination]:
+	mode = data.get(CONF_PAGINATION) or PAGINATION_NONE
+	if mode == PAGINATION_NONE:
+		return None
+	default_param = DEFAULT_OFFSET_PARAM if mode == PAGINATION_OFFSET else DEFAULT_PAGE_PARAM
+	return Pagination(
+		mode=mode,
+		items_path=data.get(CONF_ITEMS_PATH, ""),
+		next_path=data.get(CONF_NEXT_PATH, ""),
+		cursor_path=data.get(CONF_CURSOR_PATH, ""),
+		cursor_param=data.get(CONF_CURSOR_PARAM) or DEFAULT_CURSOR_PARAM,
+		page_param=data.get(CONF_PAGE_PARAM) or default_param,
+		start_page=int(data.get(CONF_START_PAGE, 0 if mode == PAGINATION_OFFSET else 1)),
+		limit=int(data.get(CONF_LIMIT) or 0),
+		total_path=data.get(CONF_TOTAL_PATH, ""),
+		max_pages=int(data.get(CONF_MAX_PAGES) or DEFAULT_MAX_PAGES),
+		max_bytes=int(data.get(CONF_MAX_BYTES) or DEFAULT_MAX_BYTES),
+	)
+
+
+def satisfied_by(filters) -> Callable[[Any], bool]:
+	"""Early-stop check: every configured path already resolves on the merged document.
+
+	Wildcard paths aggregate over all items and negative indices count from the end
+	of all of them, so neither is ever satisfied early.
+	"""
+	filters = [f for f in filters if f]
+	if not filters or any(_needs_every_page(parse_path(f)) for f in filters):
+		return lambda document: False
+	extractors = [compile_filter(f) for f in filters]
+	return lambda document: all(extract(document) is not None for extract in extractors)
+
+
+def _needs_every_page(parts) -> bool:
+	return has_wildcard(parts) or any(isinstance(part, int) and part < 0 for part in parts)
+
+
+class _Merger:
+	"""Accumulates page items into the first page's document."""
+
+	def __init__(self, items_path: str):
+		self._parts = parse_path(items_path)
+		self.document: Any = None
+		self.items: List[Any] = []
+		self.pages = 0
+		self.bytes = 0
+
+	def page_items(self, document: Any) -> List[Any]:
+		items = resolve(document, self._parts) if self._parts else document
+		return items if isinstance(items, list) else []
+
+	def add(self, document: Any, size: int) -> List[Any]:
+		items = self.page_items(document)
+		if self.document is None:
+			self.document = document
+		self.items.extend(items)
+		self.pages += 1
+		self.bytes += size
+		return items
+
+	def merged(self) -> Any:
+		if not self._parts:
+			return self.items
+		if self.document is None:
+			return None
+		# Point the first page's items at the merged list, leaving the rest of it intact
+		parent = resolve(self.document, self._parts[:-1]) if len(self._parts) > 1 else self.document
+		if isinstance(parent, (dict, list)):
+			parent[self._parts[-1]] = self.items
+		return self.document
+
+
+async def _fetch_batch(fetch_page: PageFetcher, urls: List[str], max_bytes: int) -> Tuple[List[Any], Optional[BaseException]]:
+	"""Fetch pages concurrently; when one fails, pages after it are cancelled.
+
+	Returns the pages before the first failed one (in page order) and that failure.
+	"""
+	tasks = [asyncio.ensure_future(fetch_page(url, max_bytes)) for url in urls]
+	await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+	failed = next(
+		(pos for pos, task in enumerate(tasks) if task.done() and not task.cancelled() and task.exception()), None
+	)
+	if failed is None:
+		return [task.result() for task in tasks], None
+	for task in tasks[failed + 1:]:
+		task.cancel()
+	# Earlier pages can still be merged, so let them finish
+	await asyncio.wait(tasks)
+	results: List[Any] = []
+	for task in tasks[:failed]:
+		if task.cancelled() or task.exception() is not None:
+			return results, task.exception() if not task.cancelled() else tasks[failed].exception()
+		results.append(task.result())
+	return results, tasks[failed].exception()
+
+
+def _next_link(headers: Any) -> Optional[str]:
+	"""rel="next" target from an RFC 8288 Link header."""
+	link = headers.get("Link") if headers else None
+	if not link:
+		return None
+	for part in link.split(","):
+		section = part.split(";")
+		if len(section) < 2:
+			continue
+		target = section[0].strip()
+		if any(p.strip().replace('"', "").lower() == "rel=next" for p in section[1:]):
+			return target.strip("<>")
+	return None
+
+
+async def async_fetch_paginated(
+	fetch_page: PageFetcher, url: str, pagination: Pagination, satisfied: Callable[[Any], bool]
+) -> Any:
+	"""Fetch pages until exhausted, capped, or every configured path resolves.
+
+	Hitting the byte cap mid-page keeps the pages merged so far; it only fails
+	when not even the first page fits.
+	"""
+	merger = _Merger(pagination.items_path)
+	try:
+		await _walk(fetch_page, url, pagination, satisfied, merger)
+	except ResponseTooLarge:
+		if not merger.pages:
+			raise
+		_LOGGER.warning("Stopping pagination of %s: %d byte cap reached", url, pagination.max_bytes)
+	return merger.merged()
+
+
+async def _walk(
+	fetch_page: PageFetcher, url: str, pagination: Pagination, satisfied: Callable[[Any], bool], merger: _Merger
+) -> None:
+	mode = pagination.mode
+
+	def budget() -> int:
+		# Each page may only use what the pages before it left of the byte cap
+		return max(pagination.max_bytes - merger.bytes, 0)
+
+	def exhausted() -> bool:
+		if merger.pages >= pagination.max_pages:
+			_LOGGER.debug("Stopping pagination of %s at the %d page cap", url, pagination.max_pages)
+			return True
+		if merger.bytes >= pagination.max_bytes:
+			_LOGGER.warning("Stopping pagination of %s: %d byte cap reached", url, pagination.max_bytes)
+			return True
+		return satisfied(merger.merged())
+
+	if mode in (PAGINATION_LINK, PAGINATION_CURSOR):
+		next_url: Optional[str] = url
+		seen = set()
+		while next_url and next_url not in seen:
+			seen.add(next_url)
+			document, headers, size = await fetch_page(next_url, budget())
+			merger.add(document, size)
+			if exhausted():
+				break
+			if mode == PAGINATION_LINK:
+				target = resolve(document, parse_path(pagination.next_path)) if pagination.next_path else None
+				target = target or _next_link(headers)
+				next_url = str(URL(next_url).join(URL(str(target)))) if target else None
+			else:
+				cursor = resolve(document, parse_path(pagination.cursor_path))
+				next_url = str(URL(url).update_query({pagination.cursor_param: str(cursor)})) if cursor else None
+		return
+
+	# Page/offset modes: positions are predictable
+	page_size = 0
+
+	def page_url(index: int) -> str:
+		if mode == PAGINATION_OFFSET:
+			value = pagination.start_page + index * max(pagination.limit, page_size or 1)
+		else:
+			value = pagination.start_page + index
+		query = {pagination.page_param: str(value)}
+		if pagination.limit and mode == PAGINATION_OFFSET:
+			query.setdefault("limit", str(pagination.limit))
+		return str(URL(url).update_query(query))
+
+	document, _, first_bytes = await fetch_page(page_url(0), budget())
+	page_size = len(merger.add(document, first_bytes))
+	if not page_size or exhausted():
+		return
+
+	total_pages = None
+	if pagination.total_path:
+		total = resolve(document, parse_path(pagination.total_path))
+		try:
+			total = int(total)
+			total_pages = total if mode == PAGINATION_PAGE else math.ceil(total / max(pagination.limit, page_size))
+		except (TypeError, ValueError):
+			_LOGGER.debug("No usable total at %s in %s", pagination.total_path, url)
+
+	index = 1
+	while True:
+		if total_pages is not None:
+			# Known page count: fetch the next batch concurrently, merge in order
+			remaining = min(total_pages, pagination.max_pages) - index
+			if remaining <= 0:
+				break
+			# Only as many pages as the first one says fit in what is left of the cap, sharing it equally,
+			# so a batch can't download more than the cap between them
+			left = budget()
+			count = min(CONCURRENCY, remaining, max(left // max(first_bytes, 1), 1))
+			batch = list(range(index, index + count))
+			results, error = await _fetch_batch(fetch_page, [page_url(i) for i in batch], left // count)
+		else:
+			results, error = [await fetch_page(page_url(index), budget())], None
+			batch = [index]
+		for document, _, size in results:
+			if merger.bytes + size > pagination.max_bytes:
+				_LOGGER.warning("Stopping pagination of %s: %d byte cap reached", url, pagination.max_bytes)
+				return
+			if not merger.add(document, size) or exhausted():
+				return
+		if error is not None:
+			# Pages before the failed one are merged; the caller decides whether the failure is fatal
+			raise error
+		index = batch[-1] + 1
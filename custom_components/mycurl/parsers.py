@@ -0,0 +1,183 @@
+"""Response parsers: turn JSON, CSV, XML or plain-text bodies into one document for path extraction.
+
+Whatever the format, the result is plain dicts/lists/strings, so sensors read it
+with the same filter paths (`.[0].price`, `.rss.channel.title`, `.match`).
+"""
+import csv
+import io
+import json
+import logging
+import re
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, List, NamedTuple, Optional, Pattern
+
+_LOGGER = logging.getLogger(__name__)
+
+CONF_PARSER = "parser"
+CONF_CSV_DELIMITER = "csv_delimiter"
+CONF_CSV_HEADER = "csv_header"
+CONF_CSV_KEY_COLUMN = "csv_key_column"
+CONF_TEXT_PATTERN = "text_pattern"
+CONF_TEXT_GROUP = "text_group"
+
+PARSER_AUTO = "auto"
+PARSER_JSON = "json"
+PARSER_CSV = "csv"
+PARSER_XML = "xml"
+PARSER_TEXT = "text"
+PARSERS = [PARSER_AUTO, PARSER_JSON, PARSER_CSV, PARSER_XML, PARSER_TEXT]
+
+DEFAULT_CSV_DELIMITER = ","
+
+_CSV_TYPES = ("text/csv", "application/csv", "text/tab-separated-values")
+
+
+class ParseError(ValueError):
+	"""Body could not be parsed in the selected format."""
+
+
+class ParserOptions(NamedTuple):
+	"""How one endpoint's bodies are parsed; the text pattern is compiled once here."""
+
+	parser: str = PARSER_AUTO
+	csv_delimiter: str = ""
+	csv_header: bool = True
+	csv_key_column: str = ""
+	text_pattern: Optional[Pattern] = None
+	text_group: str = ""
+
+
+def parser_options(data: Dict[str, Any]) -> ParserOptions:
+	pattern = data.get(CONF_TEXT_PATTERN) or None
+	try:
+		compiled = re.compile(pattern, re.MULTILINE) if pattern else None
+	except re.error as e:
+		_LOGGER.error("Ignoring invalid text pattern %s: %s", pattern, e)
+		compiled = None
+	return ParserOptions(
+		parser=data.get(CONF_PARSER) or PARSER_AUTO,
+		csv_delimiter=data.get(CONF_CSV_DELIMITER) or "",
+		csv_header=data.get(CONF_CSV_HEADER, True),
+		csv_key_column=data.get(CONF_CSV_KEY_COLUMN) or "",
+		text_pattern=compiled,
+		text_group=str(data.get(CONF_TEXT_GROUP) or ""),
+	)
+
+
+def detect_parser(options: ParserOptions, body: bytes, content_type: str) -> str:
+	"""The configured parser, or one picked from Content-Type and the first byte of the body."""
+	if options.parser != PARSER_AUTO:
+		return options.parser
+	mime = content_type.split(";", 1)[0].strip().lower()
+	if mime.endswith("/json") or mime.endswith("+json"):
+		return PARSER_JSON
+	if mime in _CSV_TYPES:
+		return PARSER_CSV
+	if mime.endswith("/xml") or mime.endswith("+xml"):
+		return PARSER_XML
+	start = body.lstrip()[:1]
+	if start in (b"{", b"["):
+		return PARSER_JSON
+	if start == b"<":
+		return PARSER_XML
+	return PARSER_TEXT if options.text_pattern is not None else PARSER_JSON
+
+
+def parse_body(options: ParserOptions, body: bytes, content_type: str = "") -> Any:
+	parser = detect_parser(options, body, content_type)
+	try:
+		if parser == PARSER_JSON:
+			return json.loads(body)
+		if parser == PARSER_XML:
+			# Bytes, so the document's own encoding declaration applies
+			return _parse_xml(body)
+		text = body.decode(_charset(content_type), errors="replace")
+		if parser == PARSER_CSV:
+			return _parse_csv(options, text, content_type)
+		return _parse_text(options, text)
+	except ParseError:
+		raise
+	except (ValueError, SyntaxError, csv.Error, LookupError) as e:
+		# ET.ParseError is a SyntaxError; json errors are ValueErrors
+		raise ParseError(f"Invalid {parser} response: {e}") from e
+
+
+def _charset(content_type: str) -> str:
+	for param in content_type.split(";")[1:]:
+		key, _, value = param.partition("=")
+		if key.strip().lower() == "charset" and value.strip():
+			return value.strip().strip('"')
+	return "utf-8"
+
+
+def _parse_csv(options: ParserOptions, text: str, content_type: str) -> Any:
+	"""Rows as dicts keyed by header (or lists without one), optionally keyed by a column's value."""
+	delimiter = options.csv_delimiter or ("\t" if "tab-separated" in content_type else DEFAULT_CSV_DELIMITER)
+	reader = csv.reader(io.StringIO(text), delimiter=delimiter)
+	rows: List[Any] = [row for row in reader if row]
+	if not options.csv_header:
+		return rows
+	if not rows:
+		return []
+	header = [name.strip() for name in rows[0]]
+	records = [dict(zip(header, row)) for row in rows[1:]]
+	if options.csv_key_column:
+		if options.csv_key_column not in header:
+			raise ParseError(f"No column '{options.csv_key_column}' in {header}")
+		return {record.get(options.csv_key_column): record for record in records}
+	return records
+
+
+def _local(tag: str) -> str:
+	# Drop "{namespace}" so paths read .feed.entry instead of .{http://...}feed
+	return tag.rsplit("}", 1)[-1] if tag.startswith("{") else tag
+
+
+def _element_value(element: ET.Element) -> Any:
+	"""Leaf text as a string; otherwise a dict of "@attr", child tags (lists when repeated) and "#text"."""
+	children = list(element)
+	text = (element.text or "").strip()
+	if not children and not element.attrib:
+		return text
+	node: Dict[str, Any] = {f"@{_local(key)}": value for key, value in element.attrib.items()}
+	repeated = set()
+	for child in children:
+		key = _local(child.tag)
+		value = _element_value(child)
+		if key not in node:
+			node[key] = value
+		elif key in repeated:
+			node[key].append(value)
+		else:
+			node[key] = [node[key], value]
+			repeated.add(key)
+	if text:
+		node["#text"] = text
+	return node
+
+
+def _parse_xml(body: bytes) -> Dict[str, Any]:
+	root = ET.fromstring(body)
+	return {_local(root.tag): _element_value(root)}
+
+
+def _parse_text(options: ParserOptions, text: str) -> Dict[str, Any]:
+	"""`match` is the chosen group of the first match, `matches` that group for every match.
+
+	Named groups of the first match are added under their own names.
+	"""
+	pattern = options.text_pattern
+	if pattern is None:
+		raise ParseError("The text parser needs a pattern")
+	group: Any = options.text_group or (1 if pattern.groups else 0)
+	if isinstance(group, str) and group.isdigit():
+		group = int(group)
+	first = None
+	matches = []
+	for found in pattern.finditer(text):
+		first = first or found
+		matches.append(found.group(group))
+	document: Dict[str, Any] = {"match": matches[0] if matches else None, "matches": matches}
+	if first is not None:
+		document.update({name: value for name, value in first.groupdict().items() if name not in document})
+	return document
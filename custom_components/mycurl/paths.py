@@ -0,0 +1,257 @@
+"""Filter paths for MyCurl: parsing, extraction and a flattened leaf index.
+
+Paths use the simple jq-like dot syntax the integration has always accepted
+(`.slip.advice`, `.results[0].question`, `.[0].url`) plus `[*]` / `.*` wildcards
+and `["quoted.key"]` for keys containing dots or brackets.
+"""
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+WILDCARD = "*"
+
+_SEGMENT_RE = re.compile(r'\[(-?\d+|\*|"(?:[^"\\]|\\.)*")\]|([^.\[\]]+)')
+# Keys written without quotes; anything else (e.g. `feels-like`, which jq reads as a subtraction) is quoted
+_PLAIN_KEY_RE = re.compile(r"^[A-Za-z0-9_@$:]+$")
+_BRACKET = r'\[(?:-?\d+|\*|"(?:[^"\\]|\\.)*")\]'
+# Word characters only, so jq operators (`.a-1`, `.a*100`, `.a//0`, `.a==1`) are never taken for a key
+_BARE = r"(?:\*|[\w@$:]+)"
+_SIMPLE_PATH_RE = re.compile(rf"^\.?(?:{_BRACKET}|{_BARE})(?:\.?{_BRACKET}|\.{_BARE})*$")
+
+
+def parse_path(jq_filter: str | None) -> Tuple[Any, ...]:
+	"""Split a filter into a tuple of str keys, int indices and WILDCARD."""
+	parts: List[Any] = []
+	for bracket, bare in _SEGMENT_RE.findall((jq_filter or "").strip().lstrip(".")):
+		if bare:
+			parts.append(bare)
+		elif bracket == WILDCARD:
+			parts.append(WILDCARD)
+		elif bracket.startswith('"'):
+			parts.append(bracket[1:-1].replace('\\"', '"'))
+		else:
+			parts.append(int(bracket))
+	return tuple(parts)
+
+
+def is_simple_path(jq_filter: str | None) -> bool:
+	"""True if the filter is a plain path MyCurl can evaluate itself (no jq pipes or functions)."""
+	return bool(jq_filter) and bool(_SIMPLE_PATH_RE.match(jq_filter.strip()))
+
+
+def format_path(parts: Tuple[Any, ...]) -> str:
+	"""Inverse of parse_path."""
+	out = []
+	for part in parts:
+		if isinstance(part, int) or part == WILDCARD:
+			out.append(f"[{part}]")
+		elif _PLAIN_KEY_RE.match(part) and not part.isdigit():
+			out.append(f".{part}")
+		else:
+			escaped = part.replace('"', '\\"')
+			out.append(f'["{escaped}"]')
+	path = "".join(out)
+	return path if path.startswith(".") else "." + path
+
+
+def has_wildcard(parts: Tuple[Any, ...]) -> bool:
+	return WILDCARD in parts
+
+
+def _step(node: Any, part: Any) -> Tuple[bool, Any]:
+	if isinstance(node, dict):
+		if part in node:
+			return True, node[part]
+		if isinstance(part, int) and str(part) in node:
+			return True, node[str(part)]
+		return False, None
+	if isinstance(node, list):
+		if isinstance(part, str) and part.lstrip("-").isdigit():
+			part = int(part)
+		if isinstance(part, int) and -len(node) <= part < len(node):
+			return True, node[part]
+	return False, None
+
+
+def resolve(data: Any, parts: Tuple[Any, ...]) -> Any:
+	"""Resolve parts against data; wildcard paths return the list of matches."""
+	if not has_wildcard(parts):
+		node = data
+		for part in parts:
+			found, node = _step(node, part)
+			if not found:
+				return None
+		return node
+	matches: List[Any] = []
+	_collect(data, parts, 0, matches)
+	return matches or None
+
+
+def _collect(node: Any, parts: Tuple[Any, ...], pos: int, out: List[Any]) -> None:
+	while pos < len(parts) and parts[pos] != WILDCARD:
+		found, node = _step(node, parts[pos])
+		if not found:
+			return
+		pos += 1
+	if pos == len(parts):
+		out.append(node)
+		return
+	children = node.values() if isinstance(node, dict) else node if isinstance(node, list) else ()
+	for child in children:
+		_collect(child, parts, pos + 1, out)
+
+
+@lru_cache(maxsize=4096)
+def compile_filter(jq_filter: str | None) -> Callable[[Any], Any]:
+	"""Parse a filter once and return an extractor; identical filters share one extractor."""
+	parts = parse_path(jq_filter)
+
+	def _extract(data: Any) -> Any:
+		if not data:
+			return None
+		return resolve(data, parts)
+
+	return _extract
+
+
+def value_type(value: Any) -> str:
+	if isinstance(value, bool):
+		return "boolean"
+	if isinstance(value, (int, float)):
+		return "number"
+	if isinstance(value, str):
+		return "string"
+	if isinstance(value, list):
+		return "array"
+	if isinstance(value, dict):
+		return "object"
+	return "null"
+
+
+def summarize(value: Any, width: int = 30) -> str:
+	"""Create a short preview of a value."""
+	if isinstance(value, (int, float, bool)):
+		return str(value)
+	if isinstance(value, str):
+		return f'"{value[:width]}{"…" if len(value) > width else ""}"'
+	if isinstance(value, list):
+		return f"Array[{len(value)}]"
+	if isinstance(value, dict):
+		keys = [str(k) for k in list(value.keys())[:3]]
+		more = "…" if len(value) > 3 else ""
+		return f"{{{', '.join(keys)}{more}}}"
+	if value is None:
+		return "null"
+	return str(value)[:width]
+
+
+class PathEntry(NamedTuple):
+	"""One leaf of a flattened document."""
+
+	path: str
+	parts: Tuple[Any, ...]
+	type: str
+	preview: str
+	search_key: str
+
+
+class PathIndex:
+	"""Every leaf path of a document, flattened once for searching and paging.
+
+	Empty dicts/lists count as leaves so nothing in the sample is unreachable.
+	"""
+
+	def __init__(self, document: Any, max_leaves: int = 20000):
+		self.entries: List[PathEntry] = []
+		# Exact-path lookups (type_of) during bulk creation stay O(1) per path
+		self._by_path: Dict[str, PathEntry] = {}
+		self.truncated = False
+		self._build(document, max_leaves)
+
+	def __len__(self) -> int:
+		return len(self.entries)
+
+	def _build(self, document: Any, max_leaves: int) -> None:
+		stack: List[Tuple[Tuple[Any, ...], Any]] = [((), document)]
+		while stack:
+			parts, node = stack.pop()
+			if isinstance(node, dict) and node:
+				children = [(parts + (key,), value) for key, value in node.items()]
+			elif isinstance(node, list) and node:
+				children = [(parts + (idx,), value) for idx, value in enumerate(node)]
+			else:
+				if not parts:
+					continue
+				if len(self.entries) >= max_leaves:
+					self.truncated = True
+					return
+				path = format_path(parts)
+				entry = PathEntry(path, parts, value_type(node), summarize(node), path.lower())
+				self.entries.append(entry)
+				self._by_path[path] = entry
+				continue
+			# Reversed so leaves come out in document order
+			stack.extend(reversed(children))
+
+	def search(self, query: str = "", page: int = 0, page_size: int = 50) -> Tuple[List[PathEntry], int]:
+		"""Return (entries on page, total matches).
+
+		Queries containing `*` or `[` are path patterns matching every leaf at or under
+		them (`.items[*].price`); anything else is a case-insensitive substring match,
+		falling back to a fuzzy subsequence match when nothing contains it verbatim.
+		"""
+		matches = self._match(query.strip())
+		start = max(page, 0) * page_size
+		return matches[start:start + page_size], len(matches)
+
+	def _match(self, query: str) -> List[PathEntry]:
+		if not query:
+			return self.entries
+		if WILDCARD in query or "[" in query:
+			pattern = parse_path(query)
+			return [entry for entry in self.entries if _matches_prefix(entry.parts, pattern)]
+		needle = query.lower()
+		found = [entry for entry in self.entries if needle in entry.search_key]
+		if found:
+			return found
+		return [entry for entry in self.entries if _is_subsequence(needle, entry.search_key)]
+
+	def numeric_under(self, prefix: str | None) -> List[PathEntry]:
+		"""All numeric leaves at or below a (possibly wildcard) path."""
+		pattern = parse_path(prefix)
+		return [entry for entry in self.entries if entry.type == "number" and _matches_prefix(entry.parts, pattern)]
+
+	def type_of(self, path: str) -> str | None:
+		"""Type of the leaf at exactly this path, if it is in the index."""
+		entry = self._by_path.get(path)
+		if entry is not None:
+			return entry.type
+		parts = parse_path(path)
+		# Same path spelled differently (.a.0 vs .a[0], quoting)
+		entry = self._by_path.get(format_path(parts))
+		if entry is not None:
+			return entry.type
+		# Only wildcards or `.list.0`-style indices need the slow matching scan
+		if not has_wildcard(parts) and not any(isinstance(part, str) and part.isdigit() for part in parts):
+			return None
+		for entry in self.entries:
+			if len(entry.parts) == len(parts) and _matches_prefix(entry.parts, parts):
+				return entry.type
+		return None
+
+
+def _matches_prefix(parts: Tuple[Any, ...], pattern: Tuple[Any, ...]) -> bool:
+	if len(pattern) > len(parts):
+		return False
+	for part, want in zip(parts, pattern):
+		if want == WILDCARD or part == want:
+			continue
+		if isinstance(part, int) and isinstance(want, str) and want == str(part):
+			continue
+		return False
+	return True
+
+
+def _is_subsequence(needle: str, haystack: str) -> bool:
+	it = iter(haystack)
+	return all(char in it for char in needle)
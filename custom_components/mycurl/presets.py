@@ -0,0 +1,175 @@
+"""Preset catalog for MyCurl, loaded lazily from JSON/YAML files."""
+import json
+import logging
+import os
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+BUILTIN_PRESETS_DIR = os.path.join(os.path.dirname(__file__), "presets")
+USER_PRESETS_DIR = "mycurl_presets"
+PRESET_EXTENSIONS = (".json", ".yaml", ".yml")
+
+DATA_PRESET_CATALOG = "mycurl_preset_catalog"
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class PresetIndexEntry(NamedTuple):
+	"""One searchable row of the preset index."""
+
+	key: str
+	label: str
+	tokens: frozenset
+	source: str
+
+
+def _tokenize(*texts: str) -> frozenset:
+	return frozenset(token for text in texts if text for token in _TOKEN_RE.findall(text.lower()))
+
+
+def _load_file(path: str) -> List[Dict[str, Any]]:
+	"""Parse one preset file: a single preset, a list of presets or a name -> preset mapping."""
+	with open(path, encoding="utf-8") as handle:
+		if path.endswith(".json"):
+			raw = json.load(handle)
+		else:
+			import yaml  # Only needed when someone actually ships YAML presets
+
+			raw = yaml.safe_load(handle)
+	if isinstance(raw, dict) and "url_template" in raw:
+		raw = [raw]
+	elif isinstance(raw, dict):
+		raw = [{"name": name, **preset} for name, preset in raw.items() if isinstance(preset, dict)]
+	presets = []
+	for preset in raw or []:
+		if not isinstance(preset, dict) or not preset.get("name") or not preset.get("url_template"):
+			_LOGGER.warning("Skipping invalid preset in %s: %s", path, preset)
+			continue
+		presets.append(preset)
+	return presets
+
+
+def _index_entry(preset: Dict[str, Any], source: str) -> PresetIndexEntry:
+	name = preset["name"]
+	description = preset.get("description", "")
+	return PresetIndexEntry(
+		key=name,
+		label=f"{name} - {description}" if description else name,
+		tokens=_tokenize(name, description, " ".join(preset.get("tags", []))),
+		source=source,
+	)
+
+
+class PresetCatalog:
+	"""Presets from the bundled directory plus `<config>/mycurl_presets`.
+
+	Only the index (name, label, search tokens, source file) stays in memory;
+	a preset's body is read from its file when it is picked. Index rows are
+	cached per (path, mtime) so a reload re-parses just the files that changed.
+	"""
+
+	def __init__(self, directories: List[str]):
+		self._directories = directories
+		self._files: Dict[str, Tuple[float, List[PresetIndexEntry]]] = {}
+		self._by_key: Dict[str, PresetIndexEntry] = {}
+		self._index: List[PresetIndexEntry] = []
+		self._options: Dict[str, str] = {}
+		self._loaded = False
+
+	@property
+	def loaded(self) -> bool:
+		return self._loaded
+
+	@property
+	def options(self) -> Dict[str, str]:
+		"""Precomputed key -> label mapping for the preset selector."""
+		return self._options
+
+	def __len__(self) -> int:
+		return len(self._index)
+
+	def __contains__(self, key: str) -> bool:
+		return key in self._by_key
+
+	def get(self, key: str) -> Optional[Dict[str, Any]]:
+		"""Read one preset from its file (blocking I/O)."""
+		entry = self._by_key.get(key)
+		if entry is None:
+			return None
+		try:
+			presets = _load_file(entry.source)
+		except Exception as e:
+			_LOGGER.error("Failed to load preset %s from %s: %s", key, entry.source, e)
+			return None
+		return next((preset for preset in presets if preset["name"] == key), None)
+
+	def search(self, query: str) -> Dict[str, str]:
+		"""Return key -> label for presets where every query word prefixes an index token."""
+		words = _TOKEN_RE.findall((query or "").lower())
+		if not words:
+			return self._options
+		return {
+			entry.key: entry.label
+			for entry in self._index
+			if all(any(token.startswith(word) for token in entry.tokens) for word in words)
+		}
+
+	def reload(self, force: bool = False) -> bool:
+		"""Rescan preset directories (blocking I/O); returns True if anything changed."""
+		seen = {}
+		for directory in self._directories:
+			if not os.path.isdir(directory):
+				continue
+			for filename in sorted(os.listdir(directory)):
+				if filename.endswith(PRESET_EXTENSIONS):
+					path = os.path.join(directory, filename)
+					try:
+						seen[path] = os.stat(path).st_mtime
+					except OSError:
+						continue
+		changed = force or not self._loaded or seen.keys() != self._files.keys()
+		files = {}
+		for path, mtime in seen.items():
+			cached = self._files.get(path)
+			if cached is not None and cached[0] == mtime and not force:
+				files[path] = cached
+				continue
+			changed = True
+			try:
+				# Parsed once for the index; the bodies are dropped again
+				files[path] = (mtime, [_index_entry(preset, path) for preset in _load_file(path)])
+			except Exception as e:
+				_LOGGER.error("Failed to load presets from %s: %s", path, e)
+				files[path] = (mtime, [])
+		self._files = files
+		self._loaded = True
+		if changed:
+			self._rebuild()
+		return changed
+
+	def _rebuild(self) -> None:
+		# Later directories (user presets) override bundled presets with the same name
+		by_key = {}
+		for _, entries in self._files.values():
+			for entry in entries:
+				by_key[entry.key] = entry
+		self._by_key = by_key
+		self._index = sorted(by_key.values(), key=lambda entry: entry.key.lower())
+		self._options = {entry.key: entry.label for entry in self._index}
+		_LOGGER.debug("Indexed %d MyCurl presets", len(self._index))
+
+
+async def async_get_catalog(hass: HomeAssistant, reload: bool = False, rescan: bool = True) -> PresetCatalog:
+	"""Return the shared catalog, loading it (or, with rescan, picking up changed files) in the executor."""
+	catalog = hass.data.get(DATA_PRESET_CATALOG)
+	if catalog is None:
+		catalog = hass.data[DATA_PRESET_CATALOG] = PresetCatalog(
+			[BUILTIN_PRESETS_DIR, hass.config.path(USER_PRESETS_DIR)]
+		)
+	if reload or rescan or not catalog.loaded:
+		await hass.async_add_executor_job(catalog.reload, reload)
+	return catalog
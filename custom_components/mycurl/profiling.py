@@ -0,0 +1,225 @@
+"""On-demand profiling of MyCurl refreshes (the mycurl.profile service).
+
+Instrumentation is installed by swapping wrapped methods onto the classes for
+the length of a session and restoring the originals afterwards, so nothing is
+measured, checked or allocated while no session is running.
+"""
+import asyncio
+import cProfile
+import inspect
+import io
+import logging
+import pstats
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_PROFILE = "profile"
+ATTR_DURATION = "duration"
+ATTR_MODE = "mode"
+MODE_SPANS = "spans"
+MODE_CPROFILE = "cprofile"
+PROFILE_MODES = [MODE_SPANS, MODE_CPROFILE]
+DEFAULT_DURATION = 60
+MAX_DURATION = 3600
+
+DATA_PROFILER = "mycurl_profiler"
+
+# Span stacks only exist while a session is running
+_current: ContextVar[Optional["_Frame"]] = ContextVar("mycurl_span", default=None)
+
+
+class _Frame:
+	__slots__ = ("path", "children")
+
+	def __init__(self, path: str):
+		self.path = path
+		self.children = 0.0
+
+
+class SpanRecorder:
+	"""Wall time per span stack, split into self time for collapsed-stack output.
+
+	Stacks follow the awaiting task, so concurrent refreshes don't bleed into each other.
+	"""
+
+	def __init__(self):
+		self.self_time: Dict[str, float] = defaultdict(float)
+		self.total_time: Dict[str, float] = defaultdict(float)
+		self.calls: Dict[str, int] = defaultdict(int)
+
+	def _enter(self, name: str) -> Tuple[Optional[_Frame], _Frame, Any]:
+		parent = _current.get()
+		frame = _Frame(f"{parent.path};{name}" if parent else name)
+		return parent, frame, _current.set(frame)
+
+	def _exit(self, parent: Optional[_Frame], frame: _Frame, token: Any, elapsed: float) -> None:
+		_current.reset(token)
+		# Concurrent children (gathered pages) can overlap their parent's wall time
+		self.self_time[frame.path] += max(elapsed - frame.children, 0.0)
+		self.total_time[frame.path] += elapsed
+		self.calls[frame.path] += 1
+		if parent is not None:
+			parent.children += elapsed
+
+	def wrap(self, name: str, func: Callable) -> Callable:
+		if inspect.iscoroutinefunction(func):
+			@wraps(func)
+			async def async_span(*args, **kwargs):
+				parent, frame, token = self._enter(name)
+				start = time.perf_counter()
+				try:
+					return await func(*args, **kwargs)
+				finally:
+					self._exit(parent, frame, token, time.perf_counter() - start)
+			return async_span
+
+		@wraps(func)
+		def span(*args, **kwargs):
+			parent, frame, token = self._enter(name)
+			start = time.perf_counter()
+			try:
+				return func(*args, **kwargs)
+			finally:
+				self._exit(parent, frame, token, time.perf_counter() - start)
+		return span
+
+	def folded(self) -> str:
+		"""Collapsed stacks (`a;b;c <microseconds>`), the input format of flamegraph.pl/speedscope."""
+		return "".join(
+			f"{path} {round(seconds * 1e6)}\n" for path, seconds in sorted(self.self_time.items()) if seconds > 0
+		)
+
+	def summary(self) -> str:
+		lines = [f"{'span':<48} {'calls':>8} {'total ms':>12} {'self ms':>12} {'mean ms':>10}"]
+		for path in sorted(self.total_time, key=self.total_time.get, reverse=True):
+			calls = self.calls[path]
+			total = self.total_time[path] * 1000
+			lines.append(
+				f"{path:<48} {calls:>8} {total:>12.2f} {self.self_time[path] * 1000:>12.2f} {total / calls:>10.3f}"
+			)
+		return "\n".join(lines) + "\n"
+
+
+class _TimedDecoder:
+	__slots__ = ("decompress", "flush")
+
+	def __init__(self, decoder: Any, recorder: SpanRecorder):
+		self.decompress = recorder.wrap("decode", decoder.decompress)
+		self.flush = recorder.wrap("decode", decoder.flush)
+
+
+class Profiler:
+	"""One profiling session at a time across all MyCurl entries."""
+
+	def __init__(self, hass: HomeAssistant):
+		self._hass = hass
+		self._lock = asyncio.Lock()
+
+	def _targets(self) -> List[Tuple[Any, str, str]]:
+		# (owner, attribute, span name): every phase of a refresh plus the entity writes it triggers
+		from . import request, sensor
+
+		return [
+			(sensor.MyCurlCoordinator, "_async_refresh", "refresh"),
+			(sensor.MyCurlCoordinator, "_async_update_data", "update"),
+			(sensor, "async_request_headers", "auth"),
+			(sensor.MyCurlCoordinator, "_async_fetch_body", "fetch"),
+			(request, "make_decoder", "decode"),
+			(sensor.MyCurlCoordinator, "_parse", "parse"),
+			(sensor.MyCurlCoordinator, "_shrink", "extract"),
+			(sensor.MyCurlMultiSensor, "async_write_ha_state", "state_write"),
+			(sensor.MyCurlMultiSensor, "_extract_value", "extract"),
+		]
+
+	def _install(self, recorder: SpanRecorder) -> List[Tuple[Any, str, Any, bool]]:
+		patched = []
+		for owner, attr, name in self._targets():
+			# Remember whether the attribute was the owner's own or inherited, to restore exactly
+			own = attr in vars(owner)
+			original = getattr(owner, attr)
+			if attr == "make_decoder":
+				# Decoding runs inside the download loop; time the decoders it hands out
+				wrapped = _timed_decoder_factory(original, recorder)
+			else:
+				wrapped = recorder.wrap(name, original)
+			setattr(owner, attr, wrapped)
+			patched.append((owner, attr, original, own))
+		return patched
+
+	@staticmethod
+	def _uninstall(patched: List[Tuple[Any, str, Any, bool]]) -> None:
+		for owner, attr, original, own in reversed(patched):
+			if own:
+				setattr(owner, attr, original)
+			else:
+				delattr(owner, attr)
+
+	async def async_run(self, duration: float, mode: str) -> str:
+		if self._lock.locked():
+			raise HomeAssistantError("A MyCurl profiling session is already running")
+		async with self._lock:
+			stamp = time.strftime("%Y%m%d_%H%M%S")
+			base = self._hass.config.path(f"mycurl_profile_{stamp}")
+			_LOGGER.warning("MyCurl %s profiling started for %ss", mode, duration)
+			if mode == MODE_CPROFILE:
+				profile = cProfile.Profile()
+				profile.enable()
+				try:
+					await asyncio.sleep(duration)
+				finally:
+					profile.disable()
+				paths = await self._hass.async_add_executor_job(_write_cprofile, profile, base)
+			else:
+				recorder = SpanRecorder()
+				patched = self._install(recorder)
+				try:
+					await asyncio.sleep(duration)
+				finally:
+					self._uninstall(patched)
+				paths = await self._hass.async_add_executor_job(_write_spans, recorder, base)
+			_LOGGER.warning("MyCurl profile written to %s", ", ".join(paths))
+			return paths[0]
+
+
+def _timed_decoder_factory(make_decoder: Callable, recorder: SpanRecorder) -> Callable:
+	@wraps(make_decoder)
+	def timed(encoding: str):
+		return _TimedDecoder(make_decoder(encoding), recorder)
+	return timed
+
+
+def _write_cprofile(profile: cProfile.Profile, base: str) -> List[str]:
+	# Binary stats for snakeviz/flameprof/gprof2dot, plus a readable cumulative listing
+	profile.dump_stats(f"{base}.pstats")
+	out = io.StringIO()
+	stats = pstats.Stats(profile, stream=out).sort_stats("cumulative")
+	out.write("MyCurl functions\n")
+	stats.print_stats(r"mycurl", 50)
+	out.write("\nEverything on the event loop\n")
+	stats.print_stats(50)
+	with open(f"{base}.txt", "w", encoding="utf-8") as file:
+		file.write(out.getvalue())
+	return [f"{base}.txt", f"{base}.pstats"]
+
+
+def _write_spans(recorder: SpanRecorder, base: str) -> List[str]:
+	with open(f"{base}.folded", "w", encoding="utf-8") as file:
+		file.write(recorder.folded())
+	with open(f"{base}.txt", "w", encoding="utf-8") as file:
+		file.write(recorder.summary())
+	return [f"{base}.txt", f"{base}.folded"]
+
+
+def async_get_profiler(hass: HomeAssistant) -> Profiler:
+	profiler = hass.data.get(DATA_PROFILER)
+	if profiler is None:
+		profiler = hass.data[DATA_PROFILER] = Profiler(hass)
+	return profiler
@@ -0,0 +1,210 @@
+"""HTTP request layer for MyCurl coordinators."""
+import logging
+import zlib
+from typing import Dict, List, Mapping, NamedTuple, Optional
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+_LOGGER = logging.getLogger(__name__)
+
+CONF_COMPRESSION = "compression"
+DEFAULT_COMPRESSION = True
+
+DATA_SESSION = "mycurl_session"
+DEFAULT_TIMEOUT = 30
+CHUNK_SIZE = 64 * 1024
+
+try:  # Optional codecs: advertised only when the environment can decode them
+	import brotli  # type: ignore[import]
+except ImportError:  # pragma: no cover - depends on environment
+	try:
+		import brotlicffi as brotli  # type: ignore[import,no-redef]
+	except ImportError:
+		brotli = None
+
+try:
+	import zstandard  # type: ignore[import]
+except ImportError:  # pragma: no cover - depends on environment
+	zstandard = None
+
+
+def available_encodings() -> List[str]:
+	encodings = ["gzip", "deflate"]
+	if brotli is not None:
+		encodings.append("br")
+	if zstandard is not None:
+		encodings.append("zstd")
+	return encodings
+
+
+ACCEPT_ENCODING = ", ".join(available_encodings())
+
+
+class _DeflateDecoder:
+	"""'deflate' is zlib-wrapped per the RFC but some servers send it raw."""
+
+	def __init__(self):
+		self._obj = zlib.decompressobj()
+		self._started = False
+
+	def decompress(self, chunk: bytes) -> bytes:
+		if not self._started:
+			self._started = True
+			try:
+				return self._obj.decompress(chunk)
+			except zlib.error:
+				self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+		return self._obj.decompress(chunk)
+
+	def flush(self) -> bytes:
+		return self._obj.flush()
+
+
+class _BrotliDecoder:
+	def __init__(self):
+		self._obj = brotli.Decompressor()
+		# brotli exposes process(), brotlicffi decompress()
+		self._process = getattr(self._obj, "process", None) or self._obj.decompress
+
+	def decompress(self, chunk: bytes) -> bytes:
+		return self._process(chunk)
+
+	def flush(self) -> bytes:
+		return b""
+
+
+class _ZstdDecoder:
+	def __init__(self):
+		self._obj = zstandard.ZstdDecompressor().decompressobj()
+
+	def decompress(self, chunk: bytes) -> bytes:
+		return self._obj.decompress(chunk)
+
+	def flush(self) -> bytes:
+		return b""
+
+
+def make_decoder(encoding: str):
+	"""Incremental decoder for one Content-Encoding token."""
+	if encoding in ("gzip", "x-gzip"):
+		return zlib.decompressobj(16 + zlib.MAX_WBITS)
+	if encoding == "deflate":
+		return _DeflateDecoder()
+	if encoding == "br" and brotli is not None:
+		return _BrotliDecoder()
+	if encoding == "zstd" and zstandard is not None:
+		return _ZstdDecoder()
+	raise ValueError(f"Unsupported Content-Encoding: {encoding}")
+
+
+class TransferStats:
+	"""Running byte counters for one endpoint."""
+
+	__slots__ = ("requests", "bytes_wire", "bytes_decoded", "last_encoding", "last_wire", "last_decoded")
+
+	def __init__(self):
+		self.requests = 0
+		self.bytes_wire = 0
+		self.bytes_decoded = 0
+		self.last_encoding = None
+		self.last_wire = 0
+		self.last_decoded = 0
+
+	def record(self, encoding: Optional[str], wire: int, decoded: int) -> None:
+		self.requests += 1
+		self.bytes_wire += wire
+		self.bytes_decoded += decoded
+		self.last_encoding = encoding
+		self.last_wire = wire
+		self.last_decoded = decoded
+
+	def add(self, other: "TransferStats") -> None:
+		"""Count another collector's requests here too (a fetch shared between endpoints)."""
+		self.requests += other.requests
+		self.bytes_wire += other.bytes_wire
+		self.bytes_decoded += other.bytes_decoded
+		if other.requests:
+			self.last_encoding = other.last_encoding
+			self.last_wire = other.last_wire
+			self.last_decoded = other.last_decoded
+
+	def as_dict(self) -> Dict[str, object]:
+		ratio = round(self.bytes_decoded / self.bytes_wire, 2) if self.bytes_wire else None
+		return {
+			"requests": self.requests,
+			"bytes_wire": self.bytes_wire,
+			"bytes_decoded": self.bytes_decoded,
+			"compression_ratio": ratio,
+			"last_encoding": self.last_encoding,
+			"last_bytes_wire": self.last_wire,
+			"last_bytes_decoded": self.last_decoded,
+		}
+
+
+class FetchResult(NamedTuple):
+	body: bytes
+	content_type: str
+	headers: Mapping[str, str]
+
+
+class ResponseTooLarge(Exception):
+	"""Decoded body exceeded the caller's byte budget."""
+
+
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+	"""Shared session that hands us the raw body so wire bytes can be counted."""
+	session = hass.data.get(DATA_SESSION)
+	if session is None:
+		session = hass.data[DATA_SESSION] = async_create_clientsession(hass, auto_decompress=False)
+	return session
+
+
+async def async_fetch(
+	session: aiohttp.ClientSession,
+	url: str,
+	*,
+	method: str = "GET",
+	headers: Optional[Dict[str, str]] = None,
+	compression: bool = DEFAULT_COMPRESSION,
+	stats: Optional[TransferStats] = None,
+	timeout: int = DEFAULT_TIMEOUT,
+	max_bytes: Optional[int] = None,
+) -> FetchResult:
+	"""Fetch url and return the decoded body, decoding while streaming.
+
+	With max_bytes set the download is abandoned as soon as the decoded size passes it.
+	"""
+	headers = dict(headers or {})
+	headers["Accept-Encoding"] = ACCEPT_ENCODING if compression else "identity"
+	async with session.request(
+		method, url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+	) as response:
+		response.raise_for_status()
+		content_encoding = response.headers.get("Content-Encoding", "").lower()
+		codings = [c.strip() for c in content_encoding.split(",") if c.strip() and c.strip() != "identity"]
+		# Codings are listed in the order they were applied; undo them last-to-first
+		decoders = [make_decoder(coding) for coding in reversed(codings)]
+		chunks = []
+		wire = 0
+		decoded = 0
+		async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+			wire += len(chunk)
+			for decoder in decoders:
+				chunk = decoder.decompress(chunk)
+			chunks.append(chunk)
+			decoded += len(chunk)
+			if max_bytes is not None and decoded > max_bytes:
+				raise ResponseTooLarge(f"{url} exceeded {max_bytes} bytes")
+		for pos, decoder in enumerate(decoders):
+			tail = decoder.flush()
+			for later in decoders[pos + 1:]:
+				tail = later.decompress(tail)
+			chunks.append(tail)
+		body = b"".join(chunks)
+		content_type = response.headers.get("Content-Type", "")
+		response_headers = response.headers
+	if stats is not None:
+		stats.record(content_encoding or None, wire, len(body))
+	return FetchResult(body, content_type, response_headers)
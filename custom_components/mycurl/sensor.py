@@ -1,20 +1,35 @@
 
 """Platform for MyCurl sensor integration."""
+import asyncio
 import logging
-import subprocess
-import json
+import sys
+import time
+from functools import partial
+from typing import NamedTuple
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 from datetime import timedelta
 
+import aiohttp
 import voluptuous as vol
 
 from homeassistant.components.sensor import PLATFORM_SCHEMA, SensorEntity, async_setup_entry
-from homeassistant.const import CONF_NAME, CONF_COMMAND, CONF_SCAN_INTERVAL
+from homeassistant.const import CONF_NAME, CONF_COMMAND, CONF_SCAN_INTERVAL, CONF_WEBHOOK_ID
 import homeassistant.helpers.config_validation as cv
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from . import DOMAIN
+from .auth import async_get_token_manager, async_request_headers, request_options
+from .history import CONF_HISTORY_SENSORS, CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE, STATS, RollingWindow
+from .pagination import async_fetch_paginated, pagination_options, satisfied_by
+from .parsers import parse_body, parser_options
+from .paths import compile_filter, is_simple_path
+from .request import CONF_COMPRESSION, DEFAULT_COMPRESSION, TransferStats, async_fetch, async_get_session
+from .singleflight import COMMAND_RUNNER, async_get_single_flight
+from .webhook import CONF_DEBOUNCE, DEFAULT_DEBOUNCE, async_register_webhook
+
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_NAME = "MyCurl Sensor"
@@ -26,94 +41,451 @@ CONF_DATA_TYPE = "data_type"
 DATA_TYPE_NUMERIC = "numeric"
 DATA_TYPE_TEXT = "text"
 
+CONF_LEAF_ONLY = "leaf_only"
+
+# Manual refreshes (homeassistant.update_entity) within this many seconds of the last fetch reuse its data
+CONF_MIN_REFRESH_AGE = "min_refresh_age"
+DEFAULT_MIN_REFRESH_AGE = 5
+# Shell sensors can't tell a manual update from a poll, so reusing output is opt-in there
+DEFAULT_COMMAND_MIN_REFRESH_AGE = 0
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
 	vol.Required(CONF_CURL_COMMAND): cv.string,
 	vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
 	vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): cv.time_period,
 	vol.Optional(CONF_DATA_TYPE, default=DATA_TYPE_TEXT): vol.In([DATA_TYPE_NUMERIC, DATA_TYPE_TEXT]),
+	vol.Optional(CONF_MIN_REFRESH_AGE, default=DEFAULT_COMMAND_MIN_REFRESH_AGE): vol.All(vol.Coerce(float), vol.Range(min=0)),
 })
 
 
 
+class SensorSpec(NamedTuple):
+	"""One sensor's config; only built on the fly when an entry's specs are compared."""
+
+	name: str
+	jq_filter: str | None
+	data_type: str
+
+
+class SensorSpecs:
+	"""The config of an entry's sensors, stored column-wise and owned by its coordinator.
+
+	Entities keep just their index into it, so a sensor costs three tuple slots
+	here instead of its own attributes. Filters and types repeat across thousands
+	of sensors and are interned.
+	"""
+
+	__slots__ = ("names", "filters", "data_types")
+
+	def __init__(self, names=(), filters=(), data_types=()):
+		self.names = tuple(names)
+		self.filters = tuple(filters)
+		self.data_types = tuple(data_types)
+
+	@classmethod
+	def from_config(cls, sensor_cfgs):
+		return cls(
+			(cfg.get(CONF_NAME, DEFAULT_NAME) for cfg in sensor_cfgs),
+			(sys.intern(f) if isinstance(f, str) else f for f in (cfg.get("jq_filter") for cfg in sensor_cfgs)),
+			(sys.intern(cfg.get(CONF_DATA_TYPE) or DATA_TYPE_TEXT) for cfg in sensor_cfgs),
+		)
+
+	def __len__(self):
+		return len(self.names)
+
+	def __getitem__(self, index):
+		return SensorSpec(self.names[index], self.filters[index], self.data_types[index])
+
+
+class LeafValues(dict):
+	"""Coordinator data in leaf-only mode: filter -> extracted value, no full document."""
+
+	__slots__ = ()
+
+
 def setup_platform(hass, config, add_entities, discovery_info=None):
 	"""Set up the MyCurl sensor platform from YAML."""
 	name = config.get(CONF_NAME)
 	curl_command = config.get(CONF_CURL_COMMAND)
 	scan_interval = config.get(CONF_SCAN_INTERVAL)
 	data_type = config.get(CONF_DATA_TYPE, DATA_TYPE_TEXT)
-	add_entities([MyCurlSensor(name, curl_command, scan_interval, data_type)], True)
+	min_refresh_age = config.get(CONF_MIN_REFRESH_AGE, DEFAULT_COMMAND_MIN_REFRESH_AGE)
+	add_entities([MyCurlSensor(name, curl_command, scan_interval, data_type, min_refresh_age)], True)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
 	"""Set up MyCurl sensor from a config entry (UI)."""
-	data = entry.data
-	# Multi-sensor config entries (presets/customs)
-	if "sensors" in data and isinstance(data["sensors"], list):
-		url = data["sensors"][0].get("url")
-		scan_interval = timedelta(seconds=data["sensors"][0].get("scan_interval", int(DEFAULT_SCAN_INTERVAL.total_seconds())))
-		curl_cmd = f"curl -s {url.strip()}"
-		coordinator = MyCurlCoordinator(hass, curl_cmd, scan_interval)
-		await coordinator.async_config_entry_first_refresh()
-		sensors = []
-		for sensor_cfg in data["sensors"]:
-			name = sensor_cfg.get(CONF_NAME, DEFAULT_NAME)
-			jq_filter = sensor_cfg.get("jq_filter")
-			data_type = sensor_cfg.get(CONF_DATA_TYPE, DATA_TYPE_TEXT)
-			sensors.append(MyCurlMultiSensor(name, jq_filter, data_type, coordinator))
-		async_add_entities(sensors, True)
+	data = {**entry.data, **entry.options}
+	config = _entry_config(data)
+	if config is not None:
+		# Webhook entries: upstream pushes JSON, nothing is polled
+		if config.get(CONF_WEBHOOK_ID):
+			coordinator = MyCurlWebhookCoordinator(hass, config[CONF_DEBOUNCE], config[CONF_LEAF_ONLY])
+			coordinator.set_specs(config["sensors"])
+			async_register_webhook(hass, entry, coordinator)
+			entry.async_on_unload(coordinator.async_cancel_push)
+		# Multi-sensor config entries (presets/customs) and single URL sensors with a plain path filter
+		else:
+			coordinator = MyCurlCoordinator(
+				hass, config["url"], timedelta(seconds=config[CONF_SCAN_INTERVAL]), config[CONF_COMPRESSION],
+				config[CONF_LEAF_ONLY], config["request"], config["pagination"], config["parser"],
+			)
+			coordinator.min_refresh_age = config[CONF_MIN_REFRESH_AGE]
+			coordinator.set_specs(config["sensors"])
+			await coordinator.async_config_entry_first_refresh()
+		sensors = [
+			MyCurlMultiSensor(coordinator, index, config[CONF_HISTORY_SIZE]) for index in range(len(config["sensors"]))
+		]
+		# Companion sensors read their source's in-memory window; no recorder statistics involved
+		companions = [
+			MyCurlHistorySensor(sensor, stat)
+			for sensor in sensors if sensor.history is not None
+			for stat in config[CONF_HISTORY_SENSORS]
+		]
+		hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"config": config, "coordinator": coordinator, "sensors": sensors}
+		entry.async_on_unload(lambda: hass.data[DOMAIN].pop(entry.entry_id, None))
+		entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+		async_add_entities(sensors + companions, not config.get(CONF_WEBHOOK_ID))
 		return
 	# Single sensor (legacy or custom)
 	name = data.get(CONF_NAME, DEFAULT_NAME)
 	curl_command = data.get(CONF_CURL_COMMAND)
-	# Backwards compatibility: build curl command if only URL provided
-	if not curl_command and data.get("url"):
-		curl_command = build_curl_command(data.get("url"), data.get("jq_filter"))
-		hass.config_entries.async_update_entry(entry, data={**data, CONF_CURL_COMMAND: curl_command})
+	if data.get("url"):
+		# UI entries: rebuilt from URL/filter each setup, so options edits and the compression setting apply
+		curl_command = build_curl_command(
+			data.get("url"), data.get("jq_filter"), data.get(CONF_COMPRESSION, DEFAULT_COMPRESSION)
+		)
+		if not entry.data.get(CONF_CURL_COMMAND):
+			# Backwards compatibility: entries created with only a URL get their command stored
+			hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_CURL_COMMAND: curl_command})
 	scan_interval = timedelta(seconds=data.get("scan_interval", int(DEFAULT_SCAN_INTERVAL.total_seconds())))
 	data_type = data.get(CONF_DATA_TYPE, DATA_TYPE_TEXT)
-	async_add_entities([MyCurlSensor(name, curl_command, scan_interval, data_type)], True)
+	min_refresh_age = data.get(CONF_MIN_REFRESH_AGE, DEFAULT_COMMAND_MIN_REFRESH_AGE)
+	# Arbitrary shell commands can't be patched in place; options changes reload the entry
+	entry.async_on_unload(entry.add_update_listener(_async_reload_entry))
+	async_add_entities([MyCurlSensor(name, curl_command, scan_interval, data_type, min_refresh_age)], True)
+
+
+def _entry_config(data):
+	"""Normalise entry data+options into one endpoint and its sensors.
+
+	Returns None for entries that still need the shell-command MyCurlSensor
+	(YAML-style curl_command, raw output, or a real jq program).
+	"""
+	default_interval = int(DEFAULT_SCAN_INTERVAL.total_seconds())
+	if isinstance(data.get("sensors"), list) and data["sensors"]:
+		first = data["sensors"][0]
+		url = data.get("url") or first.get("url") or ""
+		scan_interval = data.get(CONF_SCAN_INTERVAL, first.get(CONF_SCAN_INTERVAL, default_interval))
+		sensor_cfgs = data["sensors"]
+	elif data.get("url") and data.get("jq_filter") and is_simple_path(data["jq_filter"]):
+		url = data["url"]
+		scan_interval = data.get(CONF_SCAN_INTERVAL, default_interval)
+		sensor_cfgs = [data]
+	else:
+		return None
+	config = {
+		"url": url.strip(),
+		CONF_SCAN_INTERVAL: int(scan_interval),
+		CONF_COMPRESSION: data.get(CONF_COMPRESSION, DEFAULT_COMPRESSION),
+		CONF_LEAF_ONLY: data.get(CONF_LEAF_ONLY, False),
+		CONF_MIN_REFRESH_AGE: float(data.get(CONF_MIN_REFRESH_AGE, DEFAULT_MIN_REFRESH_AGE)),
+		"request": request_options(data),
+		"pagination": pagination_options(data),
+		"parser": parser_options(data),
+		CONF_HISTORY_SIZE: int(data.get(CONF_HISTORY_SIZE) or DEFAULT_HISTORY_SIZE),
+		CONF_HISTORY_SENSORS: tuple(data.get(CONF_HISTORY_SENSORS) or ()),
+		"sensors": SensorSpecs.from_config(sensor_cfgs),
+	}
+	if data.get(CONF_WEBHOOK_ID):
+		config[CONF_WEBHOOK_ID] = data[CONF_WEBHOOK_ID]
+		config[CONF_DEBOUNCE] = data.get(CONF_DEBOUNCE, DEFAULT_DEBOUNCE)
+	return config
+
+
+async def _async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+	await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+	"""Apply changed options to the running coordinator and entities instead of reloading."""
+	runtime = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+	new = _entry_config({**entry.data, **entry.options})
+	if (
+		runtime is None or new is None
+		or len(new["sensors"]) != len(runtime["sensors"])
+		or new[CONF_LEAF_ONLY] != runtime["config"][CONF_LEAF_ONLY]
+		or _history_layout(new) != _history_layout(runtime["config"])
+	):
+		await _async_reload_entry(hass, entry)
+		return
+	old = runtime["config"]
+	runtime["config"] = new
+	coordinator = runtime["coordinator"]
+
+	if new[CONF_SCAN_INTERVAL] != old[CONF_SCAN_INTERVAL] and not new.get(CONF_WEBHOOK_ID):
+		coordinator.async_set_update_interval(timedelta(seconds=new[CONF_SCAN_INTERVAL]))
+	if new[CONF_COMPRESSION] != old[CONF_COMPRESSION]:
+		# Takes effect on the next poll; not worth a refetch on its own
+		coordinator.compression = new[CONF_COMPRESSION]
+	coordinator.min_refresh_age = new[CONF_MIN_REFRESH_AGE]
+	if new.get(CONF_DEBOUNCE) != old.get(CONF_DEBOUNCE):
+		coordinator.async_set_debounce(new[CONF_DEBOUNCE])
+
+	# Filter/type/name changes only make that entity re-read the coordinator's cached data
+	old_specs, new_specs = old["sensors"], new["sensors"]
+	coordinator.set_specs(new_specs)
+	for index, sensor in enumerate(runtime["sensors"]):
+		if new_specs[index] != old_specs[index]:
+			sensor.async_reconfigure(new_specs.filters[index] != old_specs.filters[index])
+	filters_changed = set(new_specs.filters) != set(old_specs.filters)
+
+	# Only a different request justifies a refetch (or a leaf that was never kept / a page never fetched)
+	if new.get(CONF_WEBHOOK_ID):
+		return
+	if any(new[key] != old[key] for key in ("url", "request", "pagination", "parser")):
+		coordinator.set_url(new["url"])
+		coordinator.request = new["request"]
+		coordinator.pagination = new["pagination"]
+		coordinator.parser = new["parser"]
+		await coordinator.async_refresh()
+	elif filters_changed and (coordinator.leaf_only or coordinator.pagination is not None):
+		await coordinator.async_refresh()
+
+
+def _history_layout(config):
+	# Window size and which sensors get companions decide the entity set
+	numeric = tuple(data_type == DATA_TYPE_NUMERIC for data_type in config["sensors"].data_types)
+	return config[CONF_HISTORY_SIZE], config[CONF_HISTORY_SENSORS] and numeric
 
 
 class MyCurlCoordinator(DataUpdateCoordinator):
-	def __init__(self, hass, curl_command, scan_interval):
+	def __init__(
+		self, hass, url, scan_interval, compression=DEFAULT_COMPRESSION, leaf_only=False, request=None, pagination=None,
+		parser=None,
+	):
 		super().__init__(hass, _LOGGER, name="MyCurlCoordinator", update_interval=scan_interval)
-		self._curl_command = curl_command
+		self._url = url
+		self.request = request or request_options({})
+		self.pagination = pagination
+		self.parser = parser or parser_options({})
+		self.min_refresh_age = DEFAULT_MIN_REFRESH_AGE
+		# Completion time of the fetch behind the current data; joined refreshes share it
+		self.fetched_at = None
+		self._refresh_task = None
+		self.compression = compression
+		self.transfer_stats = TransferStats()
+		# Counters of the last shared fetch added to transfer_stats, so joining it twice counts once
+		self._counted_stats = None
+		# Leaf-only: keep just the values our sensors read instead of the whole parsed payload
+		self.leaf_only = leaf_only
+		self.specs = SensorSpecs()
+		self._filters = ()
+
+	def set_url(self, url):
+		self._url = url
+
+	def set_specs(self, specs):
+		self.specs = specs
+		self._filters = tuple(dict.fromkeys(f for f in specs.filters if f))
+
+	def _shrink(self, document):
+		if not self.leaf_only or document is None:
+			return document
+		return LeafValues((f, compile_filter(f)(document)) for f in self._filters)
+
+	@callback
+	def async_set_update_interval(self, scan_interval):
+		"""Retune polling without recreating the coordinator."""
+		self.update_interval = scan_interval
+		if self._listeners:
+			# Re-arm the pending timer so the new interval applies now, not after the next poll
+			self._schedule_refresh()
+
+	async def async_request_refresh(self):
+		"""Serve data younger than min_refresh_age as-is; otherwise refresh, joining any fetch in flight.
+
+		Bursts of update_entity calls share one refresh, so one fetch means one round of
+		listener updates and state writes.
+		"""
+		if self.fetched_at is not None and time.monotonic() - self.fetched_at < self.min_refresh_age:
+			return
+		if self._refresh_task is None:
+			self._refresh_task = self.hass.async_create_task(self.async_refresh())
+			self._refresh_task.add_done_callback(self._async_refresh_done)
+		# Shielded so one cancelled caller doesn't cancel the refresh for the rest
+		await asyncio.shield(self._refresh_task)
+
+	def _async_refresh_done(self, task):
+		if self._refresh_task is task:
+			self._refresh_task = None
+
+	def _request_key(self):
+		# Coordinators asking for the same thing share one fetch; paginated walks also depend on the filters.
+		# Compression is part of it so an entry that turned it off never joins a compressed fetch.
+		return (
+			self._url, self.request, self.compression, self.pagination, self.parser,
+			self._filters if self.pagination is not None else None,
+		)
 
 	async def _async_update_data(self):
-		# Run curl and parse JSON
-		try:
-			proc = await self.hass.async_add_executor_job(
-				lambda: subprocess.run(self._curl_command, shell=True, capture_output=True, text=True, timeout=30)
-			)
-			if proc.returncode == 0:
-				raw = proc.stdout.strip()
-				try:
-					return json.loads(raw)
-				except Exception:
-					_LOGGER.error("Failed to parse JSON: %s", raw)
-					return None
-			else:
-				_LOGGER.error("Curl command failed: %s", proc.stderr)
+		# SingleFlight shares a fetch between coordinators (or a scheduled and a manual refresh) on the same key;
+		# every coordinator that joins it counts its transfer in its own diagnostics
+		fetched_at, document, stats = await async_get_single_flight(self.hass).run(
+			self._request_key(), self._async_fetch_stamped
+		)
+		if stats is not self._counted_stats:
+			self.transfer_stats.add(stats)
+			self._counted_stats = stats
+		if document is not None:
+			self.fetched_at = fetched_at
+		return self._shrink(document)
+
+	async def _async_fetch_stamped(self):
+		# Counted per fetch rather than on self, since the result may be shared with other coordinators
+		stats = TransferStats()
+		document = await self._async_fetch_document(stats)
+		return time.monotonic(), document, stats
+
+	async def _async_fetch_document(self, stats):
+		if self.pagination is not None:
+			try:
+				document = await async_fetch_paginated(
+					partial(self._async_fetch_page, stats=stats), self._url, self.pagination, satisfied_by(self._filters)
+				)
+			except Exception as e:
+				_LOGGER.error("Error fetching pages of %s: %s", self._url, e)
 				return None
+			return document
+		# Fetch (negotiating compression) and parse as JSON/CSV/XML/text
+		try:
+			result = await self._async_fetch_body(self._url, stats=stats)
 		except Exception as e:
-			_LOGGER.error("Error running curl command: %s", e)
+			_LOGGER.error("Error fetching %s: %s", self._url, e)
 			return None
+		try:
+			return self._parse(result.body, result.content_type)
+		except Exception as e:
+			_LOGGER.error("Failed to parse response from %s (%s): %s", self._url, e, result.body[:400])
+			return None
+
+	async def _async_fetch_page(self, url, max_bytes, stats):
+		# A page that overruns what is left of the byte cap is abandoned mid-download
+		result = await self._async_fetch_body(url, max_bytes, stats)
+		return self._parse(result.body, result.content_type), result.headers, len(result.body)
+
+	def _parse(self, body, content_type=""):
+		return parse_body(self.parser, body, content_type)
+
+	async def _async_fetch_body(self, url, max_bytes=None, stats=None):
+		# Auth headers come from the shared token cache, so no login round trip per poll
+		for attempt in range(2):
+			headers = await async_request_headers(self.hass, self.request)
+			try:
+				result = await async_fetch(
+					async_get_session(self.hass), url, method=self.request.method, headers=headers,
+					compression=self.compression, stats=stats, max_bytes=max_bytes,
+				)
+				if stats is not None:
+					_LOGGER.debug(
+						"Fetched %s: %d bytes on the wire, %d decoded (%s)",
+						url, stats.last_wire, stats.last_decoded, stats.last_encoding or "identity",
+					)
+				return result
+			except aiohttp.ClientResponseError as e:
+				# A rejected cached token is dropped and fetched again once
+				if e.status != 401 or attempt or self.request.credentials is None:
+					raise
+				async_get_token_manager(self.hass).invalidate(self.request.credentials)
+
+
+class MyCurlWebhookCoordinator(MyCurlCoordinator):
+	"""Coordinator fed by webhook pushes instead of polling."""
+
+	def __init__(self, hass, debounce, leaf_only=False):
+		super().__init__(hass, None, None, leaf_only=leaf_only)
+		self._pending = None
+		self._debouncer = None
+		self.async_set_debounce(debounce)
+
+	@callback
+	def async_set_debounce(self, debounce):
+		# Bursts of pushes within the cooldown collapse into one update with the latest body
+		if self._debouncer is not None:
+			self._debouncer.async_cancel()
+		self._debouncer = None
+		if debounce and debounce > 0:
+			self._debouncer = Debouncer(self.hass, _LOGGER, cooldown=debounce, immediate=True, function=self._async_publish)
+
+	@callback
+	def async_push(self, payload):
+		"""Accept a parsed webhook body."""
+		self._pending = self._shrink(payload)
+		if self._debouncer is None:
+			self._async_publish()
+		else:
+			self.hass.async_create_task(self._debouncer.async_call())
+
+	@callback
+	def _async_publish(self):
+		self.async_set_updated_data(self._pending)
+
+	@callback
+	def async_cancel_push(self):
+		if self._debouncer is not None:
+			self._debouncer.async_cancel()
+
+	async def _async_update_data(self):
+		# Nothing to fetch; keep whatever was last pushed
+		return self.data
 
 
 class MyCurlMultiSensor(CoordinatorEntity, SensorEntity):
-	def __init__(self, name, jq_filter, data_type, coordinator):
+	# Window stats change every poll; keep them out of the recorder
+	_unrecorded_attributes = frozenset(STATS + ["samples"])
+	# Class-level defaults, so entities without history carry no per-instance state for it
+	_history_size = DEFAULT_HISTORY_SIZE
+	history = None
+	companions = ()
+
+	def __init__(self, coordinator, index, history_size=DEFAULT_HISTORY_SIZE):
 		super().__init__(coordinator)
-		self._name = name
-		self._jq_filter = jq_filter
-		self._data_type = data_type
-		# Set device_class and state_class if numeric
-		if self._data_type == DATA_TYPE_NUMERIC:
-			self._attr_device_class = "measurement"
-			self._attr_state_class = "measurement"
+		# Name, filter and type are read from the coordinator's SensorSpecs; no per-entity copies
+		self._index = index
+		if history_size:
+			self._history_size = history_size
+		self._configure(True)
+
+	def _configure(self, new_series):
+		if self._data_type != DATA_TYPE_NUMERIC or not self._history_size:
+			if self.history is not None:
+				self.history = None
+		elif self.history is None or new_series:
+			# A different filter is a different series; start the window over
+			self.history = RollingWindow(self._history_size)
+
+	@callback
+	def async_reconfigure(self, new_series):
+		"""Re-evaluate after the coordinator's specs changed (new_series: this sensor's filter did)."""
+		self._configure(new_series)
+		if self.hass is not None:
+			self.async_write_ha_state()
+
+	@property
+	def _data_type(self):
+		return self.coordinator.specs.data_types[self._index]
 
 	@property
 	def name(self):
-		return self._name
+		return self.coordinator.specs.names[self._index]
+
+	@property
+	def device_class(self):
+		return "measurement" if self._data_type == DATA_TYPE_NUMERIC else None
+
+	@property
+	def state_class(self):
+		return "measurement" if self._data_type == DATA_TYPE_NUMERIC else None
 
 	@property
 	def state(self):
@@ -143,42 +515,74 @@ class MyCurlMultiSensor(CoordinatorEntity, SensorEntity):
 	def icon(self):
 		return "mdi:cloud-download"
 
+	@property
+	def extra_state_attributes(self):
+		if self.history is None:
+			return None
+		return self.history.as_dict()
+
+	@callback
+	def _handle_coordinator_update(self):
+		if self.history is not None:
+			value = self.state
+			if isinstance(value, (int, float)) and not isinstance(value, bool):
+				# Stamped with the fetch time, so a second refresh of the same fetch adds nothing
+				self.history.add(value, self.coordinator.fetched_at)
+		super()._handle_coordinator_update()
+		for companion in self.companions:
+			companion.async_write_ha_state()
+
 	def _extract_value(self, data):
-		# Simple dot/jq filter: .foo.bar or .[0].foo
-		if not data or not self._jq_filter:
+		# Simple dot/jq filter: .foo.bar, .[0].foo or .items[*].price
+		jq_filter = self.coordinator.specs.filters[self._index]
+		if not jq_filter:
 			return None
-		val = data
-		parts = self._jq_filter.lstrip('.').replace('[', '.[').split('.')
-		for part in parts:
-			if not part:
-				continue
-			if part.startswith('[') and part.endswith(']'):
-				try:
-					idx = int(part[1:-1])
-					if isinstance(val, list) and 0 <= idx < len(val):
-						val = val[idx]
-					else:
-						return None
-				except Exception:
-					return None
-			else:
-				if isinstance(val, dict) and part in val:
-					val = val[part]
-				else:
-					return None
-		return val
+		if isinstance(data, LeafValues):
+			return data.get(jq_filter)
+		# Cached per filter string, so every sensor with this filter shares one extractor
+		return compile_filter(jq_filter)(data)
 
 	def _truncate(self, value):
 		if isinstance(value, str) and len(value) > 255:
-			_LOGGER.error("State for %s is longer than 255, truncating.", self._name)
+			_LOGGER.error("State for %s is longer than 255, truncating.", self.name)
 			return value[:255]
 		return value
 
 
-def build_curl_command(url: str | None, jq_filter: str | None) -> str | None:
+class MyCurlHistorySensor(SensorEntity):
+	"""One window statistic of a numeric MyCurlMultiSensor, updated with its source."""
+
+	_attr_should_poll = False
+
+	def __init__(self, source, stat):
+		self._source = source
+		self._stat = stat
+		source.companions = (*source.companions, self)
+
+	@property
+	def name(self):
+		return f"{self._source.name} {self._stat}"
+
+	@property
+	def available(self):
+		return self._source.available
+
+	@property
+	def state(self):
+		if self._source.history is None:
+			return None
+		return self._source.history.stat(self._stat)
+
+	@property
+	def icon(self):
+		return "mdi:chart-line"
+
+
+def build_curl_command(url: str | None, jq_filter: str | None, compression: bool = DEFAULT_COMPRESSION) -> str | None:
 	if not url:
 		return None
-	cmd = f"curl -s {url.strip()}"
+	# --compressed asks for gzip/deflate/brotli and has curl decode it, like the in-process fetch
+	cmd = f"curl -s --compressed {url.strip()}" if compression else f"curl -s {url.strip()}"
 	if jq_filter:
 		jq_expr = jq_filter.strip()
 		# Only append jq if filter is not empty and not just '.'
@@ -191,9 +595,12 @@ def build_curl_command(url: str | None, jq_filter: str | None) -> str | None:
 class MyCurlSensor(SensorEntity):
 	"""Representation of a Sensor that runs a curl command."""
 
-	def __init__(self, name, curl_command, scan_interval, data_type):
+	def __init__(self, name, curl_command, scan_interval, data_type, min_refresh_age=DEFAULT_COMMAND_MIN_REFRESH_AGE):
 		self._name = name
 		self._curl_command = curl_command
+		# Kept under half the poll interval so scheduled polls always rerun the command;
+		# only the burst of update_entity calls between polls is served from the last run
+		self._min_refresh_age = min(min_refresh_age, scan_interval.total_seconds() / 2)
 		self._state = None
 		self._attr_scan_interval = scan_interval
 		self._data_type = data_type
@@ -218,7 +625,8 @@ class MyCurlSensor(SensorEntity):
 	def update(self):
 		"""Fetch new state data for the sensor by running the curl command."""
 		try:
-			result = subprocess.run(self._curl_command, shell=True, capture_output=True, text=True, timeout=30)
+			# Sensors and update_entity calls running the same command at once share one subprocess
+			result = COMMAND_RUNNER.run(self._curl_command, self._min_refresh_age)
 			if result.returncode == 0:
 				value = result.stdout.strip()
 				if self._data_type == DATA_TYPE_NUMERIC:
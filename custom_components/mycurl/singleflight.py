@@ -0,0 +1,80 @@
+"""Request coalescing: concurrent refreshes for the same request share one fetch."""
+import asyncio
+import subprocess
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from homeassistant.core import HomeAssistant
+
+DATA_SINGLE_FLIGHT = "mycurl_single_flight"
+COMMAND_TIMEOUT = 30
+
+
+class SingleFlight:
+	"""At most one in-flight call per key; callers arriving meanwhile await the same task."""
+
+	def __init__(self, hass: HomeAssistant):
+		self._hass = hass
+		self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+	async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+		task = self._inflight.get(key)
+		if task is None:
+			task = self._hass.async_create_task(factory())
+			self._inflight[key] = task
+			task.add_done_callback(lambda _: self._inflight.pop(key, None))
+		# Shielded so one cancelled caller doesn't cancel the fetch for everyone else
+		return await asyncio.shield(task)
+
+	def __len__(self) -> int:
+		return len(self._inflight)
+
+
+def async_get_single_flight(hass: HomeAssistant) -> SingleFlight:
+	single_flight = hass.data.get(DATA_SINGLE_FLIGHT)
+	if single_flight is None:
+		single_flight = hass.data[DATA_SINGLE_FLIGHT] = SingleFlight(hass)
+	return single_flight
+
+
+class CommandRunner:
+	"""Thread-safe coalescing of shell commands for the executor-run legacy sensors.
+
+	Identical commands running at the same time share one subprocess, and a result
+	younger than the caller's max_age is handed back without running anything.
+	"""
+
+	def __init__(self):
+		self._lock = threading.Lock()
+		self._inflight: Dict[str, Future] = {}
+		self._recent: Dict[str, Tuple[float, subprocess.CompletedProcess]] = {}
+
+	def run(self, command: str, max_age: float = 0) -> subprocess.CompletedProcess:
+		with self._lock:
+			recent = self._recent.get(command)
+			if recent is not None and time.monotonic() - recent[0] < max_age:
+				return recent[1]
+			future = self._inflight.get(command)
+			owner = future is None
+			if owner:
+				future = self._inflight[command] = Future()
+		if not owner:
+			return future.result()
+		try:
+			result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=COMMAND_TIMEOUT)
+		except BaseException as e:
+			with self._lock:
+				self._inflight.pop(command, None)
+			future.set_exception(e)
+			raise
+		with self._lock:
+			self._inflight.pop(command, None)
+			if result.returncode == 0:
+				self._recent[command] = (time.monotonic(), result)
+		future.set_result(result)
+		return result
+
+
+COMMAND_RUNNER = CommandRunner()
@@ -0,0 +1,67 @@
+"""Webhook ingestion for MyCurl entries: upstreams POST JSON instead of being polled."""
+import hashlib
+import hmac
+import json
+import logging
+
+from aiohttp import web
+from homeassistant.components import persistent_notification, webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+
+from . import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+CONF_WEBHOOK_SECRET = "webhook_secret"
+CONF_DEBOUNCE = "debounce"
+DEFAULT_DEBOUNCE = 1.0
+
+SIGNATURE_HEADER = "X-MyCurl-Signature"
+
+
+def verify_signature(secret: str, body: bytes, signature: str | None) -> bool:
+	"""Check a hex HMAC-SHA256 of the raw body, optionally prefixed with 'sha256='."""
+	if not signature:
+		return False
+	signature = signature.strip().lower()
+	if signature.startswith("sha256="):
+		signature = signature[len("sha256="):]
+	expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+	# Bytes, since compare_digest raises TypeError on non-ASCII str and the header is attacker-controlled
+	return hmac.compare_digest(expected.encode(), signature.encode("utf-8", "replace"))
+
+
+def async_notify_webhook_url(hass: HomeAssistant, title: str, webhook_id: str, secret: bool) -> None:
+	"""Show where to POST; there is no other place in the UI the URL appears."""
+	url = webhook.async_generate_url(hass, webhook_id)
+	message = f"POST JSON to:\n\n`{url}`"
+	if secret:
+		message += f"\n\nSign each request with an HMAC-SHA256 (hex) of the raw body in the `{SIGNATURE_HEADER}` header."
+	persistent_notification.async_create(
+		hass, message, title=f"MyCurl webhook: {title}", notification_id=f"{DOMAIN}_webhook_{webhook_id}"
+	)
+
+
+def async_register_webhook(hass: HomeAssistant, entry: ConfigEntry, coordinator) -> None:
+	"""Register the entry's webhook and feed posted JSON into the coordinator."""
+	webhook_id = entry.data[CONF_WEBHOOK_ID]
+	secret = entry.data.get(CONF_WEBHOOK_SECRET) or None
+
+	async def _handle_webhook(hass: HomeAssistant, webhook_id: str, request: web.Request):
+		body = await request.read()
+		if secret and not verify_signature(secret, body, request.headers.get(SIGNATURE_HEADER)):
+			_LOGGER.warning("Rejected webhook push for %s: bad or missing signature", entry.title)
+			return web.Response(status=401)
+		try:
+			payload = json.loads(body)
+		except ValueError:
+			_LOGGER.error("Failed to parse JSON pushed to %s", entry.title)
+			return web.Response(status=400)
+		coordinator.async_push(payload)
+		return web.Response(status=202)
+
+	webhook.async_register(hass, DOMAIN, entry.title, webhook_id, _handle_webhook, allowed_methods=["POST"])
+	entry.async_on_unload(lambda: webhook.async_unregister(hass, webhook_id))
+	_LOGGER.info("MyCurl webhook for %s listening at %s", entry.title, webhook.async_generate_path(webhook_id))